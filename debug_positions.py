@@ -4,63 +4,52 @@ from pathlib import Path
 
 pdf_path = Path('data/upload/SDP Série D Ind A.pdf')
 
-with pdfplumber.open(pdf_path) as pdf:
-    # Page 1 (référence)
-    page1 = pdf.pages[0]
-    words1 = page1.extract_words(x_tolerance=3, y_tolerance=3)
-    
-    # Page 18
-    page18 = pdf.pages[17]
-    words18 = page18.extract_words(x_tolerance=3, y_tolerance=3)
 
-print("="*80)
-print("PAGE 1 - Positions X des premiers éléments de chaque ligne")
-print("="*80)
+def group_lines(words, step=5):
+    """Groupe les mots par ligne (arrondi de la position Y)."""
+    lines = {}
+    for w in words:
+        lines.setdefault(round(w['top'] / step) * step, []).append(w)
+    return lines
+
 
-# Grouper par Y
-from collections import defaultdict
-lines1 = defaultdict(list)
-for w in words1:
-    y = round(w['top'] / 5) * 5  # Arrondir pour grouper
-    lines1[y].append(w)
+def dump_line_positions(page, label):
+    """Affiche les positions X des premières lignes de données d'une page."""
+    print("=" * 80)
+    print(f"{label} - Positions X des premiers éléments de chaque ligne")
+    print("=" * 80)
 
-# Afficher les lignes avec des données
-count = 0
-for y in sorted(lines1.keys()):
-    line_words = sorted(lines1[y], key=lambda w: w['x0'])
-    text = " ".join(w['text'][:20] for w in line_words[:8])
-    if any(c.isdigit() for c in text) and len(line_words) > 3:
-        x_positions = [f"{w['x0']:.0f}" for w in line_words[:8]]
-        print(f"Y={y}: X=[{', '.join(x_positions)}]")
-        print(f"       {text[:80]}")
-        count += 1
-        if count > 5:
-            break
+    # Une seule passe d'extraction : use_text_flow évite le re-tri interne,
+    # keep_blank_chars=False écarte les blancs inutiles
+    words = page.extract_words(
+        x_tolerance=3, y_tolerance=3,
+        use_text_flow=True, keep_blank_chars=False,
+    )
+    lines = group_lines(words)
 
-print("\n" + "="*80)
-print("PAGE 18 - Positions X des premiers éléments de chaque ligne")
-print("="*80)
+    count = 0
+    for y in sorted(lines.keys()):
+        line_words = sorted(lines[y], key=lambda w: w['x0'])
+        text = " ".join(w['text'][:20] for w in line_words[:8])
+        if any(c.isdigit() for c in text) and len(line_words) > 3:
+            x_positions = [f"{w['x0']:.0f}" for w in line_words[:8]]
+            print(f"Y={y}: X=[{', '.join(x_positions)}]")
+            print(f"       {text[:80]}")
+            count += 1
+            if count > 5:
+                break
 
-lines18 = defaultdict(list)
-for w in words18:
-    y = round(w['top'] / 5) * 5
-    lines18[y].append(w)
 
-count = 0
-for y in sorted(lines18.keys()):
-    line_words = sorted(lines18[y], key=lambda w: w['x0'])
-    text = " ".join(w['text'][:20] for w in line_words[:8])
-    if any(c.isdigit() for c in text) and len(line_words) > 3:
-        x_positions = [f"{w['x0']:.0f}" for w in line_words[:8]]
-        print(f"Y={y}: X=[{', '.join(x_positions)}]")
-        print(f"       {text[:80]}")
-        count += 1
-        if count > 5:
-            break
+# Le handle reste ouvert pendant tout le traitement : une seule ouverture,
+# extraction et affichage page par page
+with pdfplumber.open(pdf_path) as pdf:
+    dump_line_positions(pdf.pages[0], "PAGE 1")
+    print()
+    dump_line_positions(pdf.pages[17], "PAGE 18")
 
-print("\n" + "="*80)
+print("\n" + "=" * 80)
 print("COMPARAISON des plages X")
-print("="*80)
+print("=" * 80)
 print("\nColonnes définies actuellement:")
 print("  composantes_du_prix:     0-195")
 print("  unite:                 195-225")
@@ -74,4 +63,3 @@ print("  part_propre:           600-660")
 print("  sous_traites_px:       660-720")
 print("  sous_traites_mt:       720-780")
 print("  total_general:         780-850")
-
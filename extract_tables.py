@@ -13,6 +13,7 @@ Exemples:
 """
 
 import argparse
+import logging
 import sys
 import os
 from pathlib import Path
@@ -30,6 +31,10 @@ from table_extractor.pipeline import PipelineConfig, ExtractionMode
 
 
 def main():
+    # La progression du pipeline passe par logging : afficher les messages
+    # bruts sur stdout, comme les print() du reste du script
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     parser = argparse.ArgumentParser(
         description="Extraction de tableaux complexes depuis des PDF",
         formatter_class=argparse.RawDescriptionHelpFormatter,
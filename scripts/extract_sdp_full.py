@@ -15,6 +15,20 @@ if str(SRC_DIR) not in sys.path:
 
 from table_extractor.sdp_extractor import SDPExtractor
 
+# orjson (Rust) sérialise ~5x plus vite que json stdlib ; repli si absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(obj, f) -> None:
+    """Sérialise obj (indenté) dans un fichier texte, via orjson si dispo."""
+    if orjson is not None:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
 
 def main() -> None:
     pdf_path = Path("data/upload/SDP Série D Ind A.pdf")
@@ -34,28 +48,29 @@ def main() -> None:
         print("Aucune page extraite, arrêt.")
         return
 
-    # Sauvegarde JSON consolidé
-    pages_dict = []
-    for page in pages:
-        page_dict = extractor.to_dict(page)
-        # Utilisateur préfère un index 1-based
-        page_dict["page_number"] = page_dict["page_number"] + 1
-        pages_dict.append(page_dict)
-
-        # Sauvegarde par page pour debug (optionnel mais pratique)
-        per_page_path = output_dir / f"page{page_dict['page_number']}.json"
-        with open(per_page_path, "w", encoding="utf-8") as f_page:
-            json.dump(page_dict, f_page, ensure_ascii=False, indent=2)
-
-    full_json = {
-        "pdf": pdf_path.name,
-        "total_pages": total_pages,
-        "pages": pages_dict,
-    }
-
+    # Sauvegarde JSON consolidé, page par page : on streame chaque dict dans
+    # le fichier au lieu de matérialiser la liste complète en mémoire
     json_path = output_dir / "sdp_full.json"
     with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(full_json, f, ensure_ascii=False, indent=2)
+        f.write('{\n"pdf": ')
+        json.dump(pdf_path.name, f, ensure_ascii=False)
+        f.write(f',\n"total_pages": {total_pages},\n"pages": [\n')
+
+        for i, page in enumerate(pages):
+            page_dict = extractor.to_dict(page)
+            # Utilisateur préfère un index 1-based
+            page_dict["page_number"] = page_dict["page_number"] + 1
+
+            # Sauvegarde par page pour debug (optionnel mais pratique)
+            per_page_path = output_dir / f"page{page_dict['page_number']}.json"
+            with open(per_page_path, "w", encoding="utf-8") as f_page:
+                _dump_json(page_dict, f_page)
+
+            if i:
+                f.write(",\n")
+            _dump_json(page_dict, f)
+
+        f.write("\n]\n}\n")
 
     print(f"[SDP] JSON consolidé : {json_path}")
 
@@ -5,13 +5,16 @@ Ce module utilise le modèle DETR pré-entraîné de Microsoft pour détecter
 les tableaux dans les images de pages PDF.
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from PIL import Image
-import torch
+import numpy as np
 from dataclasses import dataclass
 
 from .utils import BoundingBox
 
+if TYPE_CHECKING:
+    import torch
+
 
 @dataclass
 class DetectorConfig:
@@ -20,6 +23,11 @@ class DetectorConfig:
     device: str = "auto"  # "auto", "cpu", "cuda"
     confidence_threshold: float = 0.7
     nms_threshold: float = 0.5  # Non-Maximum Suppression
+    precision: str = "auto"  # "auto" (FP16 sur GPU), "fp16", "fp32"
+    # Quantification dynamique INT8 des couches linéaires sur CPU (sans
+    # dépendance supplémentaire). DETR est dominé par ses couches linéaires :
+    # gain typique de 1.5-2x sur CPU, au prix d'une légère perte de précision
+    quantize_int8: bool = False
 
 
 class TableDetector:
@@ -41,10 +49,14 @@ class TableDetector:
         self._model = None
         self._processor = None
         self._device = None
-        
+        self._model_dtype = None
+        self._size_to_target = {}  # taille de page -> tenseur target_sizes
+
     @property
-    def device(self) -> torch.device:
+    def device(self) -> "torch.device":
         """Retourne le device utilisé"""
+        import torch
+
         if self._device is None:
             if self.config.device == "auto":
                 self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -55,13 +67,37 @@ class TableDetector:
     def _load_model(self):
         """Charge le modèle si nécessaire"""
         if self._model is None:
+            import torch
             from transformers import AutoModelForObjectDetection, AutoImageProcessor
-            
+
             print(f"Chargement du modèle {self.config.model_name}...")
             self._processor = AutoImageProcessor.from_pretrained(self.config.model_name)
             self._model = AutoModelForObjectDetection.from_pretrained(self.config.model_name)
             self._model.to(self.device)
             self._model.eval()
+
+            # FP16 sur GPU : ~2x de débit Tensor Core et ~40% de VRAM en moins
+            if self.device.type == "cuda" and self.config.precision in ("auto", "fp16"):
+                self._model = self._model.half()
+                self._model_dtype = torch.float16
+
+            # torch.compile fusionne les ops encodeur/décodeur (gain GPU)
+            if self.device.type == "cuda":
+                try:
+                    self._model = torch.compile(self._model, mode="reduce-overhead")
+                except Exception:
+                    pass  # PyTorch trop ancien ou backend indisponible
+
+            # INT8 dynamique sur CPU : les poids des nn.Linear (l'essentiel
+            # du transformeur) passent en int8, l'activation reste en float
+            if self.device.type == "cpu" and self.config.quantize_int8:
+                try:
+                    self._model = torch.ao.quantization.quantize_dynamic(
+                        self._model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                except Exception as e:
+                    print(f"Quantification INT8 indisponible: {e}")
+
             print(f"Modèle chargé sur {self.device}")
     
     def detect(self, image: Image.Image) -> List[BoundingBox]:
@@ -74,6 +110,8 @@ class TableDetector:
         Returns:
             Liste de BoundingBox des tableaux détectés
         """
+        import torch
+
         self._load_model()
         
         # Convertir en RGB si nécessaire
@@ -82,21 +120,108 @@ class TableDetector:
         
         # Préparer l'image pour le modèle
         inputs = self._processor(images=image, return_tensors="pt")
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        inputs = self._prepare_inputs(inputs)
         
         # Inférence
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self._model(**inputs)
         
         # Post-traitement
-        target_sizes = torch.tensor([image.size[::-1]]).to(self.device)  # (height, width)
+        target_sizes = self._target_sizes((image.size,))  # (height, width)
         results = self._processor.post_process_object_detection(
             outputs, 
             threshold=self.config.confidence_threshold,
             target_sizes=target_sizes
         )[0]
         
-        # Convertir en BoundingBox
+        # Convertir en BoundingBox + NMS
+        return self._boxes_from_results(results)
+
+    def detect_batch(
+        self,
+        images: List[Image.Image],
+        batch_size: int = 8,
+    ) -> List[List[BoundingBox]]:
+        """
+        Détecte les tableaux dans plusieurs images.
+
+        Les images sont passées au modèle par lots : un seul forward DETR
+        par lot au lieu d'un appel detect() par image.
+
+        Args:
+            images: Liste d'images PIL
+            batch_size: Taille de lot (limite la mémoire GPU)
+
+        Returns:
+            Liste de listes de BoundingBox (une liste par image)
+        """
+        import torch
+
+        if not images:
+            return []
+
+        self._load_model()
+
+        results = []
+        for start in range(0, len(images), batch_size):
+            batch = [
+                img if img.mode == "RGB" else img.convert("RGB")
+                for img in images[start:start + batch_size]
+            ]
+
+            inputs = self._processor(images=batch, return_tensors="pt")
+            inputs = self._prepare_inputs(inputs)
+
+            with torch.inference_mode():
+                outputs = self._model(**inputs)
+
+            target_sizes = self._target_sizes(tuple(img.size for img in batch))
+            batch_results = self._processor.post_process_object_detection(
+                outputs,
+                threshold=self.config.confidence_threshold,
+                target_sizes=target_sizes
+            )
+
+            results.extend(self._boxes_from_results(res) for res in batch_results)
+
+        return results
+
+    def _target_sizes(self, sizes: Tuple[Tuple[int, int], ...]) -> "torch.Tensor":
+        """
+        Retourne le tenseur target_sizes (height, width) pour un lot de tailles.
+
+        Les pages d'un même PDF partagent presque toujours la même taille :
+        mettre le tenseur en cache évite une allocation + un transfert device
+        par appel dans la boucle de détection.
+        """
+        import torch
+
+        cached = self._size_to_target.get(sizes)
+        if cached is None:
+            cached = torch.tensor([size[::-1] for size in sizes], device=self.device)
+            self._size_to_target[sizes] = cached
+        return cached
+
+    def _prepare_inputs(self, inputs: dict) -> dict:
+        """Envoie les tenseurs sur le device (et au dtype du modèle si FP16)."""
+        # Sur GPU, la mémoire hôte épinglée permet une copie PCIe asynchrone
+        # qui se recouvre avec le calcul du lot précédent
+        pin = self.device.type == "cuda"
+        prepared = {}
+        for k, v in inputs.items():
+            if pin:
+                v = v.pin_memory().to(self.device, non_blocking=True)
+            else:
+                v = v.to(self.device)
+            if self._model_dtype is not None and v.is_floating_point():
+                v = v.to(self._model_dtype)
+            prepared[k] = v
+        return prepared
+
+    def _boxes_from_results(self, results: dict) -> List[BoundingBox]:
+        """Convertit un dict post-traité HuggingFace en BoundingBox (+ NMS)."""
+        id2label = self._model.config.id2label
+
         boxes = []
         for score, label, box in zip(results["scores"], results["labels"], results["boxes"]):
             bbox = BoundingBox(
@@ -105,70 +230,57 @@ class TableDetector:
                 x2=box[2].item(),
                 y2=box[3].item(),
                 confidence=score.item(),
-                label=self._model.config.id2label[label.item()]
+                label=id2label[label.item()]
             )
             boxes.append(bbox)
-        
+
         # Appliquer NMS si plusieurs détections
         if len(boxes) > 1:
             boxes = self._apply_nms(boxes)
-        
+
         return boxes
     
-    def detect_batch(self, images: List[Image.Image]) -> List[List[BoundingBox]]:
-        """
-        Détecte les tableaux dans plusieurs images
-        
-        Args:
-            images: Liste d'images PIL
-            
-        Returns:
-            Liste de listes de BoundingBox (une liste par image)
-        """
-        results = []
-        for image in images:
-            boxes = self.detect(image)
-            results.append(boxes)
-        return results
-    
     def _apply_nms(self, boxes: List[BoundingBox]) -> List[BoundingBox]:
         """
-        Applique Non-Maximum Suppression pour éliminer les détections redondantes
+        Applique Non-Maximum Suppression pour éliminer les détections redondantes.
+
+        Version vectorisée NumPy : à chaque itération, les IoU de la meilleure
+        box contre toutes les restantes sont calculés en une seule passe.
         """
         if not boxes:
             return boxes
-        
+
+        xyxy = np.array([[b.x1, b.y1, b.x2, b.y2] for b in boxes], dtype=np.float64)
+        scores = np.array([b.confidence for b in boxes], dtype=np.float64)
+        areas = (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+
         # Trier par confidence décroissante
-        boxes = sorted(boxes, key=lambda b: b.confidence, reverse=True)
-        
+        order = scores.argsort()[::-1]
+
         keep = []
-        while boxes:
-            best = boxes.pop(0)
-            keep.append(best)
-            
+        while order.size > 0:
+            i = order[0]
+            keep.append(i)
+
+            rest = order[1:]
+            if rest.size == 0:
+                break
+
+            # IoU de la meilleure box contre toutes les restantes
+            xx1 = np.maximum(xyxy[i, 0], xyxy[rest, 0])
+            yy1 = np.maximum(xyxy[i, 1], xyxy[rest, 1])
+            xx2 = np.minimum(xyxy[i, 2], xyxy[rest, 2])
+            yy2 = np.minimum(xyxy[i, 3], xyxy[rest, 3])
+
+            inter = np.maximum(0.0, xx2 - xx1) * np.maximum(0.0, yy2 - yy1)
+            union = areas[i] + areas[rest] - inter
+            iou = np.zeros_like(inter)
+            np.divide(inter, union, out=iou, where=union > 0)
+
             # Filtrer les boxes qui ont un IoU élevé avec la meilleure
-            boxes = [
-                b for b in boxes 
-                if self._compute_iou(best, b) < self.config.nms_threshold
-            ]
-        
-        return keep
-    
-    @staticmethod
-    def _compute_iou(box1: BoundingBox, box2: BoundingBox) -> float:
-        """Calcule l'Intersection over Union entre deux boxes"""
-        x1 = max(box1.x1, box2.x1)
-        y1 = max(box1.y1, box2.y1)
-        x2 = min(box1.x2, box2.x2)
-        y2 = min(box1.y2, box2.y2)
-        
-        if x2 < x1 or y2 < y1:
-            return 0.0
-        
-        intersection = (x2 - x1) * (y2 - y1)
-        union = box1.area + box2.area - intersection
-        
-        return intersection / union if union > 0 else 0.0
+            order = rest[iou < self.config.nms_threshold]
+
+        return [boxes[i] for i in keep]
 
 
 class TableStructureRecognizer:
@@ -184,23 +296,56 @@ class TableStructureRecognizer:
         self.confidence_threshold = confidence_threshold
         self._model = None
         self._processor = None
-        
-        if device == "auto":
-            self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        else:
-            self._device = torch.device(device)
+        self._row_ids = frozenset()
+        self._column_ids = frozenset()
+        self._cell_ids = frozenset()
+        self._header_ids = frozenset()
+        self._device_spec = device
+        self._device = None
+
+    @property
+    def device(self) -> "torch.device":
+        """Retourne le device utilisé (résolu paresseusement)"""
+        import torch
+
+        if self._device is None:
+            if self._device_spec == "auto":
+                self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            else:
+                self._device = torch.device(self._device_spec)
+        return self._device
     
     def _load_model(self):
         """Charge le modèle si nécessaire"""
         if self._model is None:
+            import torch
             from transformers import AutoModelForObjectDetection, AutoImageProcessor
-            
+
             print(f"Chargement du modèle {self.model_name}...")
             self._processor = AutoImageProcessor.from_pretrained(self.model_name)
             self._model = AutoModelForObjectDetection.from_pretrained(self.model_name)
-            self._model.to(self._device)
+            self._model.to(self.device)
             self._model.eval()
-            print(f"Modèle de structure chargé sur {self._device}")
+
+            # Précalculer les ids de labels par type d'élément : le dispatch
+            # dans recognize() se fait par entier, sans lower()/substring par box
+            row_ids, column_ids, cell_ids, header_ids = set(), set(), set(), set()
+            for label_id, name in self._model.config.id2label.items():
+                name = name.lower()
+                if "row" in name:
+                    row_ids.add(label_id)
+                elif "column" in name:
+                    column_ids.add(label_id)
+                elif "cell" in name:
+                    cell_ids.add(label_id)
+                elif "header" in name:
+                    header_ids.add(label_id)
+            self._row_ids = frozenset(row_ids)
+            self._column_ids = frozenset(column_ids)
+            self._cell_ids = frozenset(cell_ids)
+            self._header_ids = frozenset(header_ids)
+
+            print(f"Modèle de structure chargé sur {self.device}")
     
     def recognize(self, table_image: Image.Image) -> dict:
         """
@@ -212,18 +357,20 @@ class TableStructureRecognizer:
         Returns:
             Dictionnaire avec les éléments structurels détectés
         """
+        import torch
+
         self._load_model()
         
         if table_image.mode != "RGB":
             table_image = table_image.convert("RGB")
         
         inputs = self._processor(images=table_image, return_tensors="pt")
-        inputs = {k: v.to(self._device) for k, v in inputs.items()}
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
         
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self._model(**inputs)
         
-        target_sizes = torch.tensor([table_image.size[::-1]]).to(self._device)
+        target_sizes = torch.tensor([table_image.size[::-1]]).to(self.device)
         results = self._processor.post_process_object_detection(
             outputs,
             threshold=self.confidence_threshold,
@@ -239,26 +386,30 @@ class TableStructureRecognizer:
         }
         
         label_map = self._model.config.id2label
-        
+
         for score, label, box in zip(results["scores"], results["labels"], results["boxes"]):
-            label_name = label_map[label.item()]
-            bbox = BoundingBox(
+            label_id = label.item()
+
+            # Dispatch par id entier (ensembles précalculés au chargement)
+            if label_id in self._row_ids:
+                target = structure["rows"]
+            elif label_id in self._column_ids:
+                target = structure["columns"]
+            elif label_id in self._cell_ids:
+                target = structure["cells"]
+            elif label_id in self._header_ids:
+                target = structure["headers"]
+            else:
+                continue  # label non classé : pas d'allocation de BoundingBox
+
+            target.append(BoundingBox(
                 x1=box[0].item(),
                 y1=box[1].item(),
                 x2=box[2].item(),
                 y2=box[3].item(),
                 confidence=score.item(),
-                label=label_name
-            )
-            
-            if "row" in label_name.lower():
-                structure["rows"].append(bbox)
-            elif "column" in label_name.lower():
-                structure["columns"].append(bbox)
-            elif "cell" in label_name.lower():
-                structure["cells"].append(bbox)
-            elif "header" in label_name.lower():
-                structure["headers"].append(bbox)
+                label=label_map[label_id]
+            ))
         
         # Trier les lignes et colonnes
         structure["rows"] = sorted(structure["rows"], key=lambda b: b.y1)
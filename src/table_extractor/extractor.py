@@ -9,7 +9,9 @@ Ce module supporte plusieurs backends :
 from typing import List, Optional, Union, Tuple
 from pathlib import Path
 from PIL import Image
-import tempfile
+import copy
+import hashlib
+import io
 import os
 
 from .utils import BoundingBox, TableCell, ExtractedTable
@@ -42,32 +44,56 @@ class TableStructureExtractor:
         ocr_lang: str = "fra+eng",
         detect_borderless: bool = True,
         min_confidence: float = 50.0,
+        ocr_psm: Optional[int] = None,
     ):
         """
         Initialise l'extracteur
-        
+
         Args:
             ocr_engine: Moteur OCR à utiliser ("tesseract", "paddleocr", "easyocr", None)
             ocr_lang: Langues pour l'OCR (format Tesseract)
             detect_borderless: Détecter les tableaux sans bordures
             min_confidence: Confiance minimale pour les cellules OCR
+            ocr_psm: Mode de segmentation Tesseract (None = défaut img2table ;
+                6 = bloc uniforme, adapté aux régions de tableau déjà découpées)
         """
         self.ocr_engine = ocr_engine
         self.ocr_lang = ocr_lang
         self.detect_borderless = detect_borderless
         self.min_confidence = min_confidence
+        self.ocr_psm = ocr_psm
         self._ocr = None
+        # Cache des résultats OCR par hash d'image : les cellules répétées
+        # (en-têtes multi-pages, numéros de page) sont OCRisées une seule fois
+        self._result_cache = {}
     
     def _get_ocr(self):
-        """Initialise le moteur OCR"""
+        """Initialise le moteur OCR (une seule fois, réutilisé entre les pages)"""
         if self._ocr is None and self.ocr_engine:
             if self.ocr_engine == "tesseract":
                 from img2table.ocr import TesseractOCR
-                self._ocr = TesseractOCR(lang=self.ocr_lang)
+                # Le parallélisme vient de n_threads : limiter le pool OpenMP
+                # interne de tesseract évite la sur-souscription des cœurs
+                os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+                # n_threads : img2table répartit les cellules sur plusieurs
+                # instances tesseract au lieu d'une passe séquentielle
+                kwargs = {
+                    "n_threads": os.cpu_count() or 1,
+                    "lang": self.ocr_lang,
+                }
+                if self.ocr_psm is not None:
+                    kwargs["psm"] = self.ocr_psm
+                self._ocr = TesseractOCR(**kwargs)
             elif self.ocr_engine == "paddleocr":
                 from img2table.ocr import PaddleOCR
                 lang = "fr" if "fra" in self.ocr_lang else "en"
-                self._ocr = PaddleOCR(lang=lang)
+                # enable_hpi : inférence haute performance de PaddleOCR 3.x
+                # (ONNX Runtime/OpenVINO), 2-3x plus rapide sur CPU. Repli
+                # sur le runtime standard si l'option ou ses deps manquent
+                try:
+                    self._ocr = PaddleOCR(lang=lang, kw={"enable_hpi": True})
+                except Exception:
+                    self._ocr = PaddleOCR(lang=lang)
             elif self.ocr_engine == "easyocr":
                 from img2table.ocr import EasyOCR
                 langs = []
@@ -111,39 +137,52 @@ class TableStructureExtractor:
             return []
         
         from img2table.document import Image as Img2TableImage
-        
-        # Sauvegarder temporairement l'image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-            image.save(tmp.name)
-            tmp_path = tmp.name
-        
-        try:
-            # Créer le document img2table
-            doc = Img2TableImage(src=tmp_path)
-            
-            # Extraire les tableaux
-            ocr = self._get_ocr()
-            tables = doc.extract_tables(
-                ocr=ocr,
-                implicit_rows=True,
-                implicit_columns=True,
-                borderless_tables=self.detect_borderless,
-                min_confidence=self.min_confidence,
-            )
-            
-            # Convertir en ExtractedTable
-            extracted = []
-            for idx, table in enumerate(tables):
-                ext_table = self._convert_table(table, page_number, idx, bbox)
-                if ext_table:
-                    extracted.append(ext_table)
-            
-            return extracted
-            
-        finally:
-            # Nettoyer le fichier temporaire
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+
+        # Cache par contenu d'image : deux crops identiques (en-têtes répétés
+        # d'un tableau multi-pages) donnent le même OCR, inutile de le rejouer
+        cache_key = (
+            hashlib.blake2b(image.tobytes(), digest_size=16).digest(),
+            image.size,
+            (round(bbox.x1, 1), round(bbox.y1, 1)) if bbox else None,
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            # Copies indépendantes : les appelants réassignent table_index
+            tables = copy.deepcopy(cached)
+            for table in tables:
+                table.page_number = page_number
+            return tables
+
+        # Passer l'image en mémoire (img2table accepte un file-like) :
+        # évite l'aller-retour disque écriture PNG -> relecture -> suppression.
+        # compress_level=1 : le tampon est éphémère, inutile de payer zlib
+        buf = io.BytesIO()
+        image.save(buf, format='PNG', compress_level=1)
+        buf.seek(0)
+        doc = Img2TableImage(src=buf)
+
+        # Extraire les tableaux
+        ocr = self._get_ocr()
+        tables = doc.extract_tables(
+            ocr=ocr,
+            implicit_rows=True,
+            implicit_columns=True,
+            borderless_tables=self.detect_borderless,
+            min_confidence=self.min_confidence,
+        )
+
+        # Convertir en ExtractedTable
+        extracted = []
+        for idx, table in enumerate(tables):
+            ext_table = self._convert_table(table, page_number, idx, bbox)
+            if ext_table:
+                extracted.append(ext_table)
+
+        if len(self._result_cache) >= 256:
+            self._result_cache.clear()  # borne simple, suffit pour un document
+        self._result_cache[cache_key] = copy.deepcopy(extracted)
+
+        return extracted
     
     def extract_from_pdf(
         self,
@@ -197,52 +236,45 @@ class TableStructureExtractor:
         """
         Convertit un tableau img2table en ExtractedTable
         """
+        # Seul l'accès au df peut légitimement échouer (tableau mal formé) :
+        # le try/except ne couvre que lui, pas toute la conversion
         try:
-            # Obtenir les données du tableau
             df = img2table_table.df
-            if df is None or df.empty:
-                return None
-            
-            # BoundingBox du tableau
-            tb = img2table_table.bbox
-            bbox = BoundingBox(
-                x1=tb.x1 + (offset_bbox.x1 if offset_bbox else 0),
-                y1=tb.y1 + (offset_bbox.y1 if offset_bbox else 0),
-                x2=tb.x2 + (offset_bbox.x1 if offset_bbox else 0),
-                y2=tb.y2 + (offset_bbox.y1 if offset_bbox else 0),
-                confidence=1.0,
-                label="table"
-            )
-            
-            # Construire les cellules
-            cells = []
-            raw_data = []
-            
-            for row_idx, row in df.iterrows():
-                row_data = []
-                for col_idx, value in enumerate(row):
-                    cell = TableCell(
-                        row=row_idx,
-                        col=col_idx,
-                        content=str(value) if value is not None else ""
-                    )
-                    cells.append(cell)
-                    row_data.append(str(value) if value is not None else "")
-                raw_data.append(row_data)
-            
-            return ExtractedTable(
-                page_number=page_number,
-                table_index=table_index,
-                bbox=bbox,
-                cells=cells,
-                num_rows=len(df),
-                num_cols=len(df.columns),
-                raw_data=raw_data
-            )
-            
         except Exception as e:
             print(f"Erreur conversion tableau: {e}")
             return None
+        if df is None or df.empty:
+            return None
+
+        # BoundingBox du tableau (offset appliqué une fois, pas par coordonnée)
+        tb = img2table_table.bbox
+        ox = offset_bbox.x1 if offset_bbox else 0
+        oy = offset_bbox.y1 if offset_bbox else 0
+        bbox = BoundingBox(
+            x1=tb.x1 + ox,
+            y1=tb.y1 + oy,
+            x2=tb.x2 + ox,
+            y2=tb.y2 + oy,
+            confidence=1.0,
+            label="table"
+        )
+
+        # Conversion en chaînes en une passe C (fillna traite aussi les NaN
+        # pandas, qui donnaient "nan"). Les cellules ne sont pas matérialisées :
+        # ExtractedTable.iter_cells les génère depuis raw_data à la demande
+        arr = df.fillna("").astype(str).to_numpy()
+        num_rows, num_cols = arr.shape
+        raw_data = arr.tolist()
+
+        return ExtractedTable(
+            page_number=page_number,
+            table_index=table_index,
+            bbox=bbox,
+            cells=[],
+            num_rows=num_rows,
+            num_cols=num_cols,
+            raw_data=raw_data
+        )
 
 
 class HybridExtractor:
@@ -269,44 +301,61 @@ class HybridExtractor:
             ocr_engine=ocr_engine,
             ocr_lang=ocr_lang,
             detect_borderless=detect_borderless,
+            # Les régions arrivent déjà découpées par le détecteur : psm 6
+            # (bloc uniforme) court-circuite l'analyse de mise en page
+            ocr_psm=6,
         )
     
     def extract_from_image(
         self,
         image: Image.Image,
         page_number: int = 0,
+        detections: Optional[List[BoundingBox]] = None,
     ) -> List[ExtractedTable]:
         """
         Extrait les tableaux d'une image en utilisant la détection DETR
-        puis l'extraction img2table sur les régions détectées
+        puis une seule passe img2table sur la page entière
+
+        Args:
+            image: Image PIL de la page
+            page_number: Numéro de page (pour le rapport)
+            detections: BoundingBox déjà détectées (ex: via detect_batch) ;
+                None = lancer la détection sur cette image
         """
-        from .utils import crop_image
-        
-        # Étape 1: Détection avec Table Transformer
-        detections = self.detector.detect(image)
-        
+        # Étape 1: Détection avec Table Transformer (sauf si déjà faite en lot)
+        if detections is None:
+            detections = self.detector.detect(image)
+
         if not detections:
             # Fallback: utiliser img2table sur l'image entière
             return self.extractor.extract_from_image(image, page_number)
-        
-        # Étape 2: Extraction sur chaque région détectée
+
+        # Étape 2: une seule passe img2table sur la page — le prétraitement
+        # (binarisation, détection de lignes) et l'OCR sont amortis sur tous
+        # les tableaux au lieu d'être refaits pour chaque crop
+        page_tables = self.extractor.extract_from_image(image, page_number)
+
+        # Associer chaque tableau img2table à la détection DETR qui le contient
         all_tables = []
+        used = set()
         for idx, bbox in enumerate(detections):
-            # Découper la région du tableau
-            cropped = crop_image(image, bbox, padding=10)
-            
-            # Extraire avec img2table
-            tables = self.extractor.extract_from_image(
-                cropped, 
-                page_number=page_number,
-                bbox=bbox
-            )
-            
-            # Si img2table n'a rien trouvé, créer un tableau vide avec le bbox
-            if not tables:
+            matched = False
+            for t_idx, table in enumerate(page_tables):
+                if t_idx in used:
+                    continue
+                cx, cy = table.bbox.center
+                if (bbox.x1 - 10 <= cx <= bbox.x2 + 10
+                        and bbox.y1 - 10 <= cy <= bbox.y2 + 10):
+                    used.add(t_idx)
+                    table.table_index = len(all_tables)
+                    all_tables.append(table)
+                    matched = True
+
+            # Si img2table n'a rien trouvé dans la région, garder le bbox seul
+            if not matched:
                 empty_table = ExtractedTable(
                     page_number=page_number,
-                    table_index=idx,
+                    table_index=len(all_tables),
                     bbox=bbox,
                     cells=[],
                     num_rows=0,
@@ -314,11 +363,6 @@ class HybridExtractor:
                     raw_data=[]
                 )
                 all_tables.append(empty_table)
-            else:
-                # Mettre à jour les index
-                for table in tables:
-                    table.table_index = len(all_tables)
-                    all_tables.append(table)
-        
+
         return all_tables
 
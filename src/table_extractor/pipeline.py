@@ -9,16 +9,137 @@ from typing import List, Optional, Union, Callable
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import logging
 import time
 
+import numpy as np
+
 from .utils import (
-    ExtractionResult, 
-    ExtractedTable, 
+    ExtractionResult,
+    ExtractedTable,
+    BoundingBox,
+    crop_image,
     pdf_to_images,
+    iter_pdf_images,
+    pdf_page_to_image,
+    pdf_page_count,
     ensure_output_dir
 )
 from .detector import TableDetector, DetectorConfig
-from .extractor import TableStructureExtractor, HybridExtractor
+from .extractor import TableStructureExtractor, HybridExtractor, HAS_PDFPLUMBER
+from .postprocess import apply_postprocessing, merge_multipage_tables
+
+
+# Formatage paresseux (%s) : le message n'est construit que si le niveau
+# est actif, et logging n'acquiert pas le verrou stdout à chaque page
+logger = logging.getLogger(__name__)
+
+
+# Normalisation des cellules extraites par pdfplumber.
+# Une table de traduction unique (caractères unicode -> équivalents ASCII)
+# remplace une chaîne de str.replace successifs : une seule passe C par cellule.
+_CELL_TRANS = str.maketrans({"‐": "-", "·": "."})
+_ELLIPSIS = "…"
+
+
+@lru_cache(maxsize=65536)
+def _clean_cell_cached(text: str, _trans=_CELL_TRANS, _ellipsis=_ELLIPSIS) -> str:
+    """Normalisation mémoïsée (les cellules se répètent massivement).
+
+    Les constantes sont liées en arguments par défaut : accès local
+    plutôt que lookup global à chaque appel.
+    """
+    return text.translate(_trans).replace(_ellipsis, "...")
+
+
+def _clean_cell(cell) -> str:
+    """Normalise une cellule pdfplumber (None -> "", unicode -> ASCII)."""
+    if not cell:
+        return ""
+    text = cell if isinstance(cell, str) else str(cell)
+    # Raccourci : toutes les substitutions portent sur des caractères
+    # non-ASCII, une cellule ASCII pure n'a donc rien à normaliser
+    if text.isascii():
+        return text
+    return _clean_cell_cached(text)
+
+
+_RESOLVED_TABLE_SETTINGS = None
+
+
+def _default_table_settings():
+    """
+    Résout une seule fois les TableSettings par défaut de pdfplumber.
+
+    find_tables() reconstruit et revalide ses réglages à chaque appel ;
+    passer l'objet déjà résolu évite cette passe par page. Retourne None
+    (comportement par défaut) si la version de pdfplumber ne l'expose pas.
+    """
+    global _RESOLVED_TABLE_SETTINGS
+    if _RESOLVED_TABLE_SETTINGS is None:
+        try:
+            from pdfplumber.table import TableSettings
+            _RESOLVED_TABLE_SETTINGS = TableSettings.resolve(None)
+        except Exception:
+            _RESOLVED_TABLE_SETTINGS = False
+    return _RESOLVED_TABLE_SETTINGS or None
+
+
+def _clean_raw_data(raw_data: List[List]) -> List[List[str]]:
+    """
+    Nettoie un tableau brut pdfplumber (None -> "", normalisation unicode).
+
+    Passe vectorisée NumPy (np.char) sur l'ensemble du tableau plutôt qu'une
+    double boucle Python cellule par cellule. Repli Python si les lignes
+    n'ont pas toutes la même largeur.
+    """
+    arr = np.array(raw_data, dtype=object)
+    if arr.ndim != 2:
+        return [[_clean_cell(cell) for cell in row] for row in raw_data]
+
+    arr[np.equal(arr, None)] = ""
+    cleaned = np.char.replace(
+        np.char.translate(arr.astype(str), _CELL_TRANS),
+        _ELLIPSIS, "..."
+    )
+    return cleaned.tolist()
+
+
+def _prefetch_pages(page_images, depth: int = 2):
+    """
+    Recouvre le rendu des pages avec leur traitement (producteur-consommateur).
+
+    Un thread démon consomme le générateur de rendu et pousse les pages dans
+    une file bornée : la page N+1 est rastérisée par PDFium (code C, GIL
+    relâché) pendant que la page N passe en détection/OCR. La borne limite
+    l'avance du producteur à `depth` pages en mémoire.
+
+    Yields:
+        Les éléments du générateur source, dans le même ordre
+    """
+    import queue
+    import threading
+
+    q = queue.Queue(maxsize=depth)
+    _end = object()
+
+    def _producer():
+        try:
+            for item in page_images:
+                q.put(item)
+            q.put(_end)
+        except BaseException as exc:  # remontée dans le thread consommateur
+            q.put(exc)
+
+    threading.Thread(target=_producer, daemon=True).start()
+    while True:
+        item = q.get()
+        if item is _end:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
 
 
 class ExtractionMode(Enum):
@@ -44,14 +165,30 @@ class PipelineConfig:
     
     # Rendu PDF
     dpi: int = 200
+    # DPI équivalent pour l'OCR des crops (None = celui du rendu). La qualité
+    # OCR dépend de la résolution du crop, pas la détection : permet de rendre
+    # les pages à 150 DPI et de ré-agrandir seulement les régions détectées
+    ocr_dpi: Optional[int] = None
     
     # Sortie
     output_format: List[str] = field(default_factory=lambda: ["json", "csv"])
     save_images: bool = True
+    annotation_dpi: int = 100  # DPI des images annotées (inspection visuelle)
     
     # Pages
     pages: Optional[List[int]] = None  # None = toutes les pages
 
+    # Parallélisme (1 = séquentiel; >1 = ProcessPoolExecutor par page)
+    workers: int = 1
+
+    # Cache disque des détections DETR (~/.cache/table_extractor) : évite de
+    # rejouer le forward Table Transformer lors des ré-exécutions sur le même PDF
+    use_cache: bool = False
+
+    # Précharger le modèle DETR en arrière-plan dès la construction du
+    # pipeline : le chargement (~1-5 s) se recouvre avec le rendu des pages
+    warmup: bool = False
+
 
 class TableExtractionPipeline:
     """
@@ -75,7 +212,25 @@ class TableExtractionPipeline:
         self._detector = None
         self._extractor = None
         self._hybrid = None
+        self._rendered_pages = None  # cache des pages rendues (pour l'annotation)
+        self._pdf_hash = None  # (chemin, mtime) -> hash, pour le cache disque
+        self._plumber_pdf = None  # document pdfplumber ouvert (un seul parse)
+        self._plumber_path = None
+        self._visual_guide = None  # instance VisualGuide réutilisée entre pages
+        self._pdf_exists = False  # stat() fait une fois par extraction
+        self._warmup_thread = None
+        if self.config.warmup and self.config.mode != ExtractionMode.FAST:
+            import threading
+            self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+            self._warmup_thread.start()
     
+    def _warmup(self) -> None:
+        """Charge le modèle de détection en arrière-plan (thread démon)."""
+        try:
+            self.detector._load_model()
+        except Exception:
+            pass  # le chemin d'extraction rechargera et remontera l'erreur
+
     @property
     def detector(self) -> TableDetector:
         """Détecteur de tableaux (lazy loading)"""
@@ -129,10 +284,19 @@ class TableExtractionPipeline:
         """
         pdf_path = Path(pdf_path)
         start_time = time.time()
-        
-        print(f"[PDF] Traitement de: {pdf_path.name}")
-        print(f"   Mode: {self.config.mode.value}")
-        print(f"   OCR: {self.config.ocr_engine or 'desactive'}")
+        # Un seul stat() ici : _extract_page_accurate est appelé par page et
+        # revérifiait l'existence du fichier (un syscall par page)
+        self._pdf_exists = pdf_path.exists()
+
+        # Attendre la fin du préchargement éventuel avant de toucher au
+        # détecteur (évite un double chargement concurrent du modèle)
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+            self._warmup_thread = None
+
+        logger.info("[PDF] Traitement de: %s", pdf_path.name)
+        logger.info("   Mode: %s", self.config.mode.value)
+        logger.info("   OCR: %s", self.config.ocr_engine or "desactive")
         
         # Initialiser le résultat
         result = ExtractionResult(
@@ -153,15 +317,17 @@ class TableExtractionPipeline:
         except Exception as e:
             error_msg = f"Erreur lors de l'extraction: {str(e)}"
             result.errors.append(error_msg)
-            print(f"[ERREUR] {error_msg}")
+            logger.error("[ERREUR] %s", error_msg)
         
         # Sauvegarder les résultats
         if output_dir:
             self._save_results(result, pdf_path, output_dir)
-        
+        self._rendered_pages = None  # libérer les images après la sauvegarde
+        self._close_plumber_pdf()
+
         elapsed = time.time() - start_time
-        print(f"\n[OK] Extraction terminee en {elapsed:.1f}s")
-        print(f"   {len(result.tables)} tableau(x) extrait(s)")
+        logger.info("\n[OK] Extraction terminee en %.1fs", elapsed)
+        logger.info("   %d tableau(x) extrait(s)", len(result.tables))
         
         return result
     
@@ -172,7 +338,7 @@ class TableExtractionPipeline:
         progress_callback: Optional[Callable] = None,
     ) -> ExtractionResult:
         """Extraction rapide avec img2table directement"""
-        print("   Extraction directe avec img2table...")
+        logger.info("   Extraction directe avec img2table...")
         
         tables = self.extractor.extract_from_pdf(
             pdf_path,
@@ -191,53 +357,135 @@ class TableExtractionPipeline:
         progress_callback: Optional[Callable] = None,
     ) -> ExtractionResult:
         """Extraction avec conversion en images"""
-        
+
+        # Traitement parallèle par page si demandé
+        if self.config.workers > 1:
+            return self._extract_pages_parallel(pdf_path, result, progress_callback)
+
         # Convertir le PDF en images
-        print(f"   Conversion PDF -> Images (DPI: {self.config.dpi})...")
-        images = pdf_to_images(pdf_path, dpi=self.config.dpi)
-        result.total_pages = len(images)
-        print(f"   {len(images)} page(s) chargée(s)")
-        
+        logger.info("   Conversion PDF -> Images (DPI: %d)...", self.config.dpi)
+        result.total_pages = pdf_page_count(pdf_path)
+        logger.info("   %d page(s)", result.total_pages)
+
         # Filtrer les pages si spécifié
-        pages_to_process = self.config.pages or list(range(len(images)))
-        
+        pages_to_process = self.config.pages or list(range(result.total_pages))
+        pages_to_process = [p for p in pages_to_process if p < result.total_pages]
+
+        if self.config.save_images:
+            # Rendus conservés pour l'annotation : évite une seconde
+            # rasterisation complète dans _save_annotated_images
+            images = pdf_to_images(pdf_path, dpi=self.config.dpi)
+            self._rendered_pages = images
+            page_images = ((p, images[p]) for p in pages_to_process)
+        else:
+            # Rendu paresseux : une seule page en mémoire à la fois. En mode
+            # HYBRID, rendu directement en niveaux de gris (3x moins de RAM
+            # par page) : le détecteur reconvertit en RGB à l'inférence et
+            # l'OCR travaille nativement sur un canal. Le mode ACCURATE garde
+            # le RGB — le guide visuel repose sur les bandes de couleur.
+            page_images = _prefetch_pages(iter_pdf_images(
+                pdf_path, dpi=self.config.dpi, pages=pages_to_process,
+                grayscale=self.config.mode == ExtractionMode.HYBRID,
+            ))
+
+        # En mode HYBRID avec pages matérialisées : un seul forward DETR par
+        # lot de pages au lieu d'une inférence batch-1 par page
+        batch_detections = None
+        if self.config.mode == ExtractionMode.HYBRID and self.config.save_images:
+            batch_detections = self.hybrid.detector.detect_batch(
+                [images[p] for p in pages_to_process]
+            )
+
         # Traiter chaque page
-        for i, page_num in enumerate(pages_to_process):
-            if page_num >= len(images):
-                continue
-                
-            image = images[page_num]
-            
+        for i, (page_num, image) in enumerate(page_images):
             if progress_callback:
                 progress_callback(i + 1, len(pages_to_process), f"Page {page_num + 1}")
             
-            print(f"   [Page {page_num + 1}/{len(images)}]", end=" ")
-            
             try:
                 if self.config.mode == ExtractionMode.ACCURATE:
                     tables = self._extract_page_accurate(image, page_num, pdf_path)
                 else:  # HYBRID
-                    tables = self.hybrid.extract_from_image(image, page_num)
+                    tables = self.hybrid.extract_from_image(
+                        image, page_num,
+                        detections=batch_detections[i] if batch_detections else None,
+                    )
                 
                 result.tables.extend(tables)
-                print(f"[OK] {len(tables)} tableau(x)")
+                logger.info("   [Page %d/%d] [OK] %d tableau(x)",
+                            page_num + 1, result.total_pages, len(tables))
                 
             except Exception as e:
                 error_msg = f"Erreur page {page_num + 1}: {str(e)}"
                 result.errors.append(error_msg)
-                print(f"[X] {error_msg}")
+                logger.error("   [Page %d/%d] [X] %s",
+                             page_num + 1, result.total_pages, error_msg)
         
         # Fusionner les tableaux multi-pages
         if len(result.tables) > 1:
-            from .postprocess import merge_multipage_tables
             original_count = len(result.tables)
             result.tables = merge_multipage_tables(result.tables)
             if len(result.tables) < original_count:
                 merged = original_count - len(result.tables)
-                print(f"   [FUSION] {merged} tableau(x) fusionné(s) (multi-pages)")
+                logger.info("   [FUSION] %d tableau(x) fusionné(s) (multi-pages)", merged)
         
         return result
     
+    def _extract_pages_parallel(
+        self,
+        pdf_path: Path,
+        result: ExtractionResult,
+        progress_callback: Optional[Callable] = None,
+    ) -> ExtractionResult:
+        """
+        Extraction parallèle : une page par processus worker.
+
+        Les objets pdfplumber/PIL ne sont pas picklables, donc chaque worker
+        ré-ouvre le PDF et rend sa propre page. Les résultats sont re-triés
+        par numéro de page pour garder un ordre déterministe.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        result.total_pages = pdf_page_count(pdf_path)
+        pages_to_process = self.config.pages or list(range(result.total_pages))
+        pages_to_process = [p for p in pages_to_process if p < result.total_pages]
+
+        # Pas plus de workers que de pages : inutile de payer le fork
+        # de processus qui ne recevront jamais de tâche
+        max_workers = min(self.config.workers, len(pages_to_process)) or 1
+        logger.info("   Extraction parallèle (%d workers)...", max_workers)
+
+        page_results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_extract_page_job, str(pdf_path), page_num, self.config): page_num
+                for page_num in pages_to_process
+            }
+            for i, future in enumerate(as_completed(futures)):
+                page_num, tables, error = future.result()
+                page_results[page_num] = (tables, error)
+                if progress_callback:
+                    progress_callback(i + 1, len(pages_to_process), f"Page {page_num + 1}")
+
+        # Ré-assembler dans l'ordre des pages
+        for page_num in pages_to_process:
+            tables, error = page_results[page_num]
+            if error:
+                result.errors.append(error)
+                logger.error("   [Page %d] [X] %s", page_num + 1, error)
+            else:
+                result.tables.extend(tables)
+                logger.info("   [Page %d] [OK] %d tableau(x)", page_num + 1, len(tables))
+
+        # Fusionner les tableaux multi-pages
+        if len(result.tables) > 1:
+            original_count = len(result.tables)
+            result.tables = merge_multipage_tables(result.tables)
+            if len(result.tables) < original_count:
+                merged = original_count - len(result.tables)
+                logger.info("   [FUSION] %d tableau(x) fusionné(s) (multi-pages)", merged)
+
+        return result
+
     def _extract_page_accurate(
         self,
         image,
@@ -251,53 +499,178 @@ class TableExtractionPipeline:
         1. Si PDF natif disponible → utiliser pdfplumber directement (plus fiable)
         2. Sinon → DETR + guidage visuel + img2table
         """
-        from .utils import crop_image
-        
         # Stratégie 1: PDF natif avec pdfplumber (plus fiable pour texte extractible)
-        try:
-            import pdfplumber
-            if pdf_path and pdf_path.exists():
+        if HAS_PDFPLUMBER and pdf_path and self._pdf_exists:
+            try:
                 tables = self._extract_with_pdfplumber_direct(pdf_path, page_number)
                 if tables:
-                    print(f"[PDFPLUMBER] {len(tables)} tableau(x)")
+                    logger.info("[PDFPLUMBER] %d tableau(x)", len(tables))
                     return tables
-        except ImportError:
-            pass
-        except Exception as e:
-            print(f"      [PDFPLUMBER] Échec: {e}")
-        
+            except Exception as e:
+                logger.warning("      [PDFPLUMBER] Échec: %s", e)
+
         # Stratégie 2: DETR + guidage visuel
-        detections = self.detector.detect(image)
-        
+        detections = self._detect_cached(image, pdf_path, page_number)
+
         try:
-            from .visual_guide import VisualGuide
-            guide = VisualGuide()
+            # Instance réutilisée entre les pages (l'import cv2 et la
+            # construction ne sont payés qu'une fois)
+            if self._visual_guide is None:
+                from .visual_guide import VisualGuide
+                self._visual_guide = VisualGuide()
+            guide = self._visual_guide
             visual_regions = guide.analyze_page(image)
             
             if visual_regions:
                 detections = guide.merge_bboxes(detections, visual_regions)
-                print(f"      [VISUAL] {len(visual_regions)} région(s)")
+                logger.info("      [VISUAL] %d région(s)", len(visual_regions))
         except Exception as e:
-            print(f"      [VISUAL] Échec: {e}")
+            logger.warning("      [VISUAL] Échec: %s", e)
         
         if not detections:
+            # Pré-filtre de quelques millisecondes (Canny + Hough, SIMD)
+            # avant de payer des secondes d'OCR pleine page : une page sans
+            # la moindre ligne de tableau est abandonnée directement
+            if not self._has_table_features(image):
+                logger.info("      [SKIP] aucune structure de tableau détectée")
+                return []
             return self.extractor.extract_from_image(image, page_number)
-        
+
         # Fallback: img2table sur les images croppées
+        upscale = (self.config.ocr_dpi / self.config.dpi
+                   if self.config.ocr_dpi and self.config.ocr_dpi > self.config.dpi
+                   else 1.0)
         tables = []
         for idx, bbox in enumerate(detections):
             cropped = crop_image(image, bbox, padding=10)
+            if upscale > 1.0:
+                # Ré-agrandir le crop au DPI OCR demandé (LANCZOS) : seul le
+                # petit crop paie le surcoût, pas la page entière
+                from PIL import Image as PILImage
+                cropped = cropped.resize(
+                    (round(cropped.width * upscale), round(cropped.height * upscale)),
+                    PILImage.LANCZOS,
+                )
             extracted = self.extractor.extract_from_image(
                 cropped,
                 page_number=page_number,
                 bbox=bbox
             )
             for table in extracted:
+                if upscale > 1.0:
+                    # Ramener le bbox (exprimé dans le crop agrandi) dans le
+                    # repère de la page rendue à config.dpi
+                    tb = table.bbox
+                    tb.x1 = bbox.x1 + (tb.x1 - bbox.x1) / upscale
+                    tb.y1 = bbox.y1 + (tb.y1 - bbox.y1) / upscale
+                    tb.x2 = bbox.x1 + (tb.x2 - bbox.x1) / upscale
+                    tb.y2 = bbox.y1 + (tb.y2 - bbox.y1) / upscale
                 table.table_index = len(tables)
                 tables.append(table)
         
         return tables
     
+    @staticmethod
+    def _has_table_features(image) -> bool:
+        """
+        Vérifie à bas coût qu'une page contient des lignes de tableau.
+
+        Détection de contours (Canny) puis de segments (HoughLinesP) : s'il
+        n'y a pas au moins quelques segments horizontaux ou verticaux longs,
+        il n'y a pas de grille — inutile de lancer l'OCR pleine page.
+        """
+        import cv2
+
+        arr = np.asarray(image if image.mode == "L" else image.convert("L"))
+        edges = cv2.Canny(arr, 50, 150)
+        # Segments d'au moins 1/8 de la largeur de page : filtre le texte
+        min_length = max(100, arr.shape[1] // 8)
+        lines = cv2.HoughLinesP(
+            edges, 1, np.pi / 180, threshold=80,
+            minLineLength=min_length, maxLineGap=5,
+        )
+        if lines is None:
+            return False
+
+        # Forme (N, 1, 4) ou (N, 4) selon la version d'OpenCV
+        lines = lines.reshape(-1, 4)
+        dx = np.abs(lines[:, 2] - lines[:, 0])
+        dy = np.abs(lines[:, 3] - lines[:, 1])
+        axis_aligned = np.count_nonzero((dx < 5) | (dy < 5))
+        return axis_aligned >= 3
+
+    def _get_plumber_pdf(self, pdf_path: Path):
+        """
+        Retourne le document pdfplumber du PDF courant, ouvert une seule fois.
+
+        Ouvrir le PDF à chaque page refaisait tout le parsing (xref, flux,
+        arbre de pages) : O(N²) sur un document de N pages. Le document reste
+        ouvert pour toute l'extraction et est fermé en fin de extract().
+        """
+        import pdfplumber
+
+        if self._plumber_pdf is None or self._plumber_path != str(pdf_path):
+            self._close_plumber_pdf()
+            self._plumber_pdf = pdfplumber.open(pdf_path)
+            self._plumber_path = str(pdf_path)
+        return self._plumber_pdf
+
+    def _close_plumber_pdf(self) -> None:
+        """Ferme le document pdfplumber mis en cache, s'il existe."""
+        if self._plumber_pdf is not None:
+            try:
+                self._plumber_pdf.close()
+            except Exception:
+                pass
+            self._plumber_pdf = None
+            self._plumber_path = None
+
+    def _detect_cached(
+        self,
+        image,
+        pdf_path: Optional[Path],
+        page_number: int,
+    ) -> List:
+        """
+        Détection DETR avec cache disque optionnel.
+
+        Les bboxes détectées ne dépendent que du PDF, de la page, du DPI et du
+        seuil de confiance : les mémoriser sur disque permet de rejouer le
+        pipeline (autre OCR, autre post-traitement) sans refaire le forward.
+        """
+        if not self.config.use_cache or pdf_path is None or not pdf_path.exists():
+            return self.detector.detect(image)
+
+        import hashlib
+        import pickle
+
+        mtime = pdf_path.stat().st_mtime_ns
+        if self._pdf_hash is None or self._pdf_hash[0] != (str(pdf_path), mtime):
+            digest = hashlib.sha1(pdf_path.read_bytes()).hexdigest()[:16]
+            self._pdf_hash = ((str(pdf_path), mtime), digest)
+        pdf_hash = self._pdf_hash[1]
+
+        cache_dir = Path.home() / ".cache" / "table_extractor" / pdf_hash
+        cache_file = cache_dir / (
+            f"{page_number}_{self.config.dpi}_{self.config.detection_confidence}.pkl"
+        )
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # cache corrompu : on refait la détection
+
+        detections = self.detector.detect(image)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(detections, f)
+        except OSError:
+            pass  # cache non inscriptible : tant pis
+        return detections
+
     def _extract_with_pdfplumber_direct(
         self,
         pdf_path: Path,
@@ -308,135 +681,123 @@ class TableExtractionPipeline:
         
         Plus fiable pour les PDFs natifs avec texte extractible.
         """
-        import pdfplumber
-        from .utils import BoundingBox, TableCell
-        from .postprocess import apply_postprocessing
-        
         tables = []
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            if page_number >= len(pdf.pages):
-                return []
-            
-            page = pdf.pages[page_number]
-            pdf_tables = page.find_tables()
-            
-            for idx, pdf_table in enumerate(pdf_tables):
-                raw_data = pdf_table.extract()
-                if not raw_data:
-                    continue
-                
-                # Nettoyer les None
-                raw_data = [[cell if cell else "" for cell in row] for row in raw_data]
-                
-                # Filtrer les petites tables (moins de 3 lignes ou 3 colonnes)
-                if len(raw_data) < 3 or len(raw_data[0]) < 3:
-                    continue
-                
-                bbox = BoundingBox(
-                    x1=pdf_table.bbox[0],
-                    y1=pdf_table.bbox[1],
-                    x2=pdf_table.bbox[2],
-                    y2=pdf_table.bbox[3],
-                    confidence=1.0,
-                    label="table"
-                )
-                
-                cells = []
-                for row_idx, row in enumerate(raw_data):
-                    for col_idx, content in enumerate(row):
-                        cells.append(TableCell(
-                            row=row_idx,
-                            col=col_idx,
-                            content=content,
-                        ))
-                
+
+        pdf = self._get_plumber_pdf(pdf_path)
+        if page_number >= len(pdf.pages):
+            return []
+
+        page = pdf.pages[page_number]
+        pdf_tables = page.find_tables(table_settings=_default_table_settings())
+
+        for idx, pdf_table in enumerate(pdf_tables):
+            raw_data = pdf_table.extract()
+            if not raw_data:
+                continue
+
+            # Nettoyer les None et normaliser les caractères
+            raw_data = _clean_raw_data(raw_data)
+
+            # Filtrer les petites tables (moins de 3 lignes ou 3 colonnes)
+            if len(raw_data) < 3 or len(raw_data[0]) < 3:
+                continue
+
+            bbox = BoundingBox(
+                x1=pdf_table.bbox[0],
+                y1=pdf_table.bbox[1],
+                x2=pdf_table.bbox[2],
+                y2=pdf_table.bbox[3],
+                confidence=1.0,
+                label="table"
+            )
+
+            # Les cellules sont construites une seule fois, par le
+            # post-traitement (chaque processeur reconstruit la table) :
+            # inutile de faire une première passe row x col ici
+            extracted = ExtractedTable(
+                page_number=page_number,
+                table_index=len(tables),
+                bbox=bbox,
+                cells=[],
+                num_rows=len(raw_data),
+                num_cols=len(raw_data[0]) if raw_data else 0,
+                raw_data=raw_data,
+            )
+
+            # Appliquer le post-traitement
+            extracted = apply_postprocessing(extracted)
+            tables.append(extracted)
+
+        return tables
+
+    def _extract_with_pdfplumber(
+        self,
+        pdf_path: Path,
+        page_number: int,
+        bboxes: List,
+    ) -> List[ExtractedTable]:
+        """Extrait le contenu des tableaux avec pdfplumber + post-traitement."""
+        tables = []
+
+        pdf = self._get_plumber_pdf(pdf_path)
+        if page_number >= len(pdf.pages):
+            return []
+
+        page = pdf.pages[page_number]
+        pdf_tables = page.find_tables(table_settings=_default_table_settings())
+
+        if not pdf_tables or not bboxes:
+            return []
+
+        # Matrice de chevauchement N détections x M tables pdfplumber en une
+        # passe NumPy (broadcasting) au lieu de N x M appels _compute_overlap.
+        # Conversion des coordonnées : image DPI -> points PDF (72 DPI)
+        scale = 72.0 / self.config.dpi
+        det = np.array([(b.x1, b.y1, b.x2, b.y2) for b in bboxes], dtype=np.float64)
+        det *= scale
+        tab = np.array([t.bbox for t in pdf_tables], dtype=np.float64)
+
+        ix1 = np.maximum(det[:, None, 0], tab[None, :, 0])
+        iy1 = np.maximum(det[:, None, 1], tab[None, :, 1])
+        ix2 = np.minimum(det[:, None, 2], tab[None, :, 2])
+        iy2 = np.minimum(det[:, None, 3], tab[None, :, 3])
+        inter = np.clip(ix2 - ix1, 0, None) * np.clip(iy2 - iy1, 0, None)
+
+        det_areas = (det[:, 2] - det[:, 0]) * (det[:, 3] - det[:, 1])
+        tab_areas = (tab[:, 2] - tab[:, 0]) * (tab[:, 3] - tab[:, 1])
+        min_areas = np.minimum(det_areas[:, None], tab_areas[None, :])
+        overlap = np.zeros_like(inter)
+        np.divide(inter, min_areas, out=overlap, where=min_areas > 0)
+
+        best_indices = overlap.argmax(axis=1)
+        best_overlaps = overlap.max(axis=1)
+
+        # Pour chaque bbox détectée, extraire la meilleure table pdfplumber
+        for bbox_idx, bbox in enumerate(bboxes):
+            best_table = pdf_tables[best_indices[bbox_idx]]
+            best_overlap = best_overlaps[bbox_idx]
+
+            if best_overlap > 0.3:
+                raw_data = best_table.extract()
+                # Nettoyer les None et normaliser les caractères
+                raw_data = _clean_raw_data(raw_data)
+
+                # Cellules construites par le post-traitement (cf.
+                # _extract_with_pdfplumber_direct)
                 extracted = ExtractedTable(
                     page_number=page_number,
                     table_index=len(tables),
                     bbox=bbox,
-                    cells=cells,
+                    cells=[],
                     num_rows=len(raw_data),
                     num_cols=len(raw_data[0]) if raw_data else 0,
                     raw_data=raw_data,
                 )
-                
+
                 # Appliquer le post-traitement
                 extracted = apply_postprocessing(extracted)
                 tables.append(extracted)
-        
-        return tables
-    
-    def _extract_with_pdfplumber(
-        self,
-        pdf_path: Path,
-        page_number: int,
-        bboxes: List,
-    ) -> List[ExtractedTable]:
-        """Extrait le contenu des tableaux avec pdfplumber + post-traitement."""
-        import pdfplumber
-        from .utils import BoundingBox, TableCell
-        from .postprocess import apply_postprocessing
-        
-        tables = []
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            if page_number >= len(pdf.pages):
-                return []
-            
-            page = pdf.pages[page_number]
-            pdf_tables = page.find_tables()
-            
-            # Pour chaque bbox détectée, trouver la table pdfplumber correspondante
-            for bbox_idx, bbox in enumerate(bboxes):
-                # Convertir les coordonnées (image DPI -> PDF points)
-                # Ratio approximatif : image_coord / dpi * 72
-                scale = 72.0 / self.config.dpi
-                pdf_bbox = (
-                    bbox.x1 * scale,
-                    bbox.y1 * scale,
-                    bbox.x2 * scale,
-                    bbox.y2 * scale,
-                )
-                
-                # Trouver la meilleure table pdfplumber qui correspond
-                best_table = None
-                best_overlap = 0
-                
-                for pdf_table in pdf_tables:
-                    overlap = self._compute_overlap(pdf_bbox, pdf_table.bbox)
-                    if overlap > best_overlap:
-                        best_overlap = overlap
-                        best_table = pdf_table
-                
-                if best_table and best_overlap > 0.3:
-                    raw_data = best_table.extract()
-                    # Nettoyer les None
-                    raw_data = [[cell if cell else "" for cell in row] for row in raw_data]
-                    
-                    cells = []
-                    for row_idx, row in enumerate(raw_data):
-                        for col_idx, content in enumerate(row):
-                            cells.append(TableCell(
-                                row=row_idx,
-                                col=col_idx,
-                                content=content,
-                            ))
-                    
-                    extracted = ExtractedTable(
-                        page_number=page_number,
-                        table_index=len(tables),
-                        bbox=bbox,
-                        cells=cells,
-                        num_rows=len(raw_data),
-                        num_cols=len(raw_data[0]) if raw_data else 0,
-                        raw_data=raw_data,
-                    )
-                    
-                    # Appliquer le post-traitement
-                    extracted = apply_postprocessing(extracted)
-                    tables.append(extracted)
-        
+
         return tables
     
     @staticmethod
@@ -467,18 +828,27 @@ class TableExtractionPipeline:
         """Sauvegarde les résultats"""
         output_dir = ensure_output_dir(output_dir, pdf_path.name)
         
-        print(f"\n   [SAVE] Sauvegarde dans: {output_dir}")
+        logger.info("\n   [SAVE] Sauvegarde dans: %s", output_dir)
         
         # JSON
         if "json" in self.config.output_format:
             json_path = output_dir / "tables.json"
             result.save_json(json_path)
-            print(f"      - {json_path.name}")
+            logger.info("      - %s", json_path.name)
         
         # CSV
         if "csv" in self.config.output_format:
             csv_files = result.save_all_csv(output_dir)
-            print(f"      - {len(csv_files)} fichier(s) CSV")
+            logger.info("      - %d fichier(s) CSV", len(csv_files))
+
+        # Parquet (un seul fichier au format long, writer Arrow)
+        if "parquet" in self.config.output_format:
+            parquet_path = output_dir / "tables.parquet"
+            try:
+                result.save_parquet(parquet_path)
+                logger.info("      - %s", parquet_path.name)
+            except ImportError:
+                logger.info("      - parquet ignoré (pyarrow non installé)")
         
         # Images annotées
         if self.config.save_images and result.tables:
@@ -491,10 +861,9 @@ class TableExtractionPipeline:
         output_dir: Path,
     ) -> None:
         """Sauvegarde les images avec les tableaux annotés"""
-        from PIL import ImageDraw
-        
-        images = pdf_to_images(pdf_path, dpi=self.config.dpi)
-        
+        import cv2
+        from PIL import Image as PILImage
+
         # Grouper les tableaux par page
         tables_by_page = {}
         for table in result.tables:
@@ -502,32 +871,104 @@ class TableExtractionPipeline:
             if page not in tables_by_page:
                 tables_by_page[page] = []
             tables_by_page[page].append(table)
-        
-        # Annoter et sauvegarder
-        for page_num, tables in tables_by_page.items():
-            if page_num >= len(images):
-                continue
-            
-            image = images[page_num].copy()
-            draw = ImageDraw.Draw(image)
-            
+
+        # Ne rendre que les pages contenant des tableaux : la rasterisation
+        # à 200 DPI des pages vides dominait le coût de cette étape
+        rendered = self._rendered_pages
+        total_pages = len(rendered) if rendered is not None else pdf_page_count(pdf_path)
+        pages_with_tables = [p for p in sorted(tables_by_page) if p < total_pages]
+
+        # Réutiliser le rendu de l'extraction si disponible (le cache est
+        # libéré juste après la sauvegarde). Sinon, rendre au DPI
+        # d'annotation, plus bas : ces images ne servent qu'à l'inspection
+        # visuelle, ~4x moins de pixels à encoder — et en une seule passe
+        # iter_pdf_images (un seul open/parse du PDF pour toutes les pages)
+        if rendered is not None:
+            page_iter = ((p, rendered[p]) for p in pages_with_tables)
+            scale = 1.0
+        else:
+            ann_dpi = min(self.config.annotation_dpi, self.config.dpi)
+            page_iter = iter_pdf_images(
+                pdf_path, dpi=ann_dpi, pages=pages_with_tables
+            )
+            scale = ann_dpi / self.config.dpi
+
+        def _annotate_one(page_num, image):
+            tables = tables_by_page[page_num]
+
+            # Dessin OpenCV sur un tableau NumPy (C vectorisé) plutôt que
+            # PIL.ImageDraw ; l'image PIL est RGB, donc rouge = (255, 0, 0).
+            # np.array copie : les vues PIL sont en lecture seule pour cv2
+            arr = np.array(image.convert("RGB") if image.mode != "RGB" else image)
+
             for table in tables:
                 bbox = table.bbox
+                x1, y1 = int(bbox.x1 * scale), int(bbox.y1 * scale)
+                x2, y2 = int(bbox.x2 * scale), int(bbox.y2 * scale)
                 # Rectangle rouge
-                draw.rectangle(
-                    [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
-                    outline="red",
-                    width=3
-                )
+                cv2.rectangle(arr, (x1, y1), (x2, y2), (255, 0, 0), 3)
                 # Label
-                draw.text(
-                    (bbox.x1 + 5, bbox.y1 + 5),
+                cv2.putText(
+                    arr,
                     f"Table {table.table_index + 1}",
-                    fill="red"
+                    (x1 + 5, y1 + 20),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6,
+                    (255, 0, 0),
+                    2,
                 )
-            
+
             img_path = output_dir / f"page{page_num + 1}_annotated.png"
-            image.save(img_path)
+            # compress_level=1 : image de debug, le temps zlib n'en vaut pas la peine
+            PILImage.fromarray(arr).save(img_path, compress_level=1)
+
+        # Pages indépendantes : dessin + encodage PNG en parallèle sur un
+        # pool de threads (cv2 et l'encodeur zlib de PIL relâchent le GIL).
+        # La soumission draine page_iter au fil de l'eau : sur le chemin de
+        # repli, le rendu de la page N+1 recouvre l'encodage de la page N
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as ex:
+            futures = [
+                ex.submit(_annotate_one, page_num, image)
+                for page_num, image in page_iter
+            ]
+            for future in futures:
+                future.result()
+
+
+# Pipeline réutilisé entre les tâches d'un même processus worker : construire
+# (et donc recharger les modèles) à chaque page annulerait le gain du pool
+_WORKER_PIPELINE: Optional[TableExtractionPipeline] = None
+
+
+def _extract_page_job(
+    pdf_path: str,
+    page_num: int,
+    config: PipelineConfig,
+) -> tuple:
+    """
+    Traite une page dans un processus worker.
+
+    Fonction de niveau module (picklable). Retourne (page_num, tables, erreur).
+    """
+    global _WORKER_PIPELINE
+    if _WORKER_PIPELINE is None or _WORKER_PIPELINE.config != config:
+        _WORKER_PIPELINE = TableExtractionPipeline(config)
+    pipeline = _WORKER_PIPELINE
+    path = Path(pdf_path)
+    # Le worker n'entre pas par extract() : stat() une fois par tâche
+    pipeline._pdf_exists = path.exists()
+    try:
+        image = pdf_page_to_image(path, page_num, dpi=config.dpi)
+        if config.mode == ExtractionMode.ACCURATE:
+            tables = pipeline._extract_page_accurate(image, page_num, path)
+        else:  # HYBRID
+            tables = pipeline.hybrid.extract_from_image(image, page_num)
+        return page_num, tables, None
+    except Exception as e:
+        return page_num, [], f"Erreur page {page_num + 1}: {str(e)}"
 
 
 def quick_extract(
@@ -10,14 +10,53 @@ Le format SDP a une structure spécifique :
 """
 
 import pdfplumber
+import re
+from bisect import bisect_left
 from pathlib import Path
 from collections import defaultdict
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 import json
 
 
-@dataclass
+# Motifs compilés une fois au chargement du module : les helpers de parsing
+# du récap sont appelés des dizaines de fois par page
+# Montant au format français : "4 011,71" avec € optionnel
+_AMOUNT_RE = re.compile(r'[\d\s]+,\d+\s*€?')
+# Pourcentage ou décimale en fin de texte : "0,10" ou "10%"
+_PCT_RE = re.compile(r'(\d+(?:,\d+)?)\s*%?\s*$')
+# "25% Total A 10 029,28" / "Total A 10 029,28"
+_TOTAL_A_PCT_RE = re.compile(r'(\d+)\s*%\s*Total\s*A\s*([\d\s]+,\d+)', re.IGNORECASE)
+_TOTAL_B_PCT_RE = re.compile(r'(\d+)\s*%\s*Total\s*B\s*([\d\s]+,\d+)', re.IGNORECASE)
+_TOTAL_A_RE = re.compile(r'Total\s*A\s*([\d\s]+,\d+)', re.IGNORECASE)
+_TOTAL_B_RE = re.compile(r'Total\s*B\s*([\d\s]+,\d+)', re.IGNORECASE)
+# Nettoyage de montants (_clean_amount), fusionné en un seul motif :
+# espaces autour d'une virgule, espaces entre chiffres (lookarounds, donc
+# tous les écarts sont traités, pas un sur deux comme avec des groupes
+# consommants), et position vide entre un chiffre et €
+_CLEAN_AMOUNT_RE = re.compile(r'\s*,\s*|(?<=\d)\s+(?=\d)|(?<=\d)(?=€)')
+# Nombre avec séparateurs de milliers, décimales et € optionnels
+_NUMBER_RE = re.compile(r'^[\d\s]+([,\.]\d+)?(\s*€)?$')
+# Mots-clés déclencheurs du parsing récap : un seul balayage C pour écarter
+# les lignes sans intérêt avant la chaîne de elif (qui peut en faire ~12)
+_RECAP_KEY_RE = re.compile(r'TOTAL 5|K1|K2|K3|Total [AB]|PRIX DE VENTE|Arrondi')
+# Unités de mesure courantes des documents SDP
+_UNITS = frozenset({'m', 'm2', 'm3', 'ml', 'h', 't', 'j', 'u', 'kg', 'l', 'ens', 'forf', 'km'})
+
+
+def _clean_amount_repl(m: "re.Match") -> str:
+    """Remplacement pour _CLEAN_AMOUNT_RE selon l'alternative qui a matché."""
+    s = m.group()
+    if ',' in s:
+        return ','
+    if s:  # espaces entre chiffres
+        return ''
+    return ' '  # match vide entre un chiffre et €
+
+
+# slots=True : pas de __dict__ par ligne (des milliers de lignes de détail
+# par document), accès aux 14 champs plus rapide
+@dataclass(slots=True)
 class SDPRow:
     """Représente une ligne du tableau SDP."""
     # Colonne 1: Description
@@ -109,25 +148,38 @@ SDP_COLUMNS = [
 class SDPExtractor:
     """Extracteur pour documents SDP."""
     
-    def __init__(self):
+    def __init__(self, keep_raw_lines: bool = False):
         self.default_columns = SDP_COLUMNS
         self.page_columns = {}  # Colonnes calibrées par page
+        # Conserver le texte brut des lignes dans SDPPage.raw_text_lines
+        # (débogage uniquement : sur un gros document cela garde des
+        # centaines de milliers de petites chaînes vivantes)
+        self.keep_raw_lines = keep_raw_lines
+        # Les gabarits SDP sont fixes : la même ligne de formules revient à
+        # l'identique sur toutes les pages d'un document. Mémoïser la
+        # calibration par contenu de la ligne évite de la recalculer par page
+        self._calib_cache: Dict[tuple, List[Tuple[int, int, str, str]]] = {}
     
-    def _calibrate_columns_from_formula_line(self, lines: List[Tuple[float, List[dict]]]) -> List[Tuple[int, int, str, str]]:
+    def _calibrate_columns_from_formula_line(self, lines: List[Tuple[float, List[dict], str]]) -> List[Tuple[int, int, str, str]]:
         """
         Calibre les colonnes en détectant la ligne de formules "a b 1=axb 2 3 4 5=..."
         """
         # Chercher la ligne contenant "1=axb" ou "a b"
         formula_words = None
-        for _, line_words in lines:
-            text = " ".join(w['text'] for w in line_words)
+        for _, line_words, text in lines:
             if "1=axb" in text or ("a" in text and "b" in text and "2" in text and "3" in text):
                 formula_words = sorted(line_words, key=lambda w: w['x0'])
                 break
         
         if not formula_words:
             return self.default_columns
-        
+
+        # Même ligne de formules (textes + positions arrondies) déjà vue ?
+        cache_key = tuple((w['text'], round(w['x0'])) for w in formula_words)
+        cached = self._calib_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Extraire les positions des marqueurs de colonnes
         markers = {}
         for w in formula_words:
@@ -155,6 +207,7 @@ class SDPExtractor:
                 markers['total_general'] = x
         
         if len(markers) < 4:
+            self._calib_cache[cache_key] = self.default_columns
             return self.default_columns
         
         # Construire les colonnes calibrées
@@ -218,7 +271,8 @@ class SDPExtractor:
                 x_end = min(next_x, markers[col] + 60)
                 columns.append((x_start, x_end, col, col_names.get(col, col)))
                 prev_x = x_end
-        
+
+        self._calib_cache[cache_key] = columns
         return columns
     
     def extract_page(self, pdf_path: Path, page_number: int) -> SDPPage:
@@ -235,70 +289,101 @@ class SDPExtractor:
         with pdfplumber.open(pdf_path) as pdf:
             if page_number >= len(pdf.pages):
                 raise ValueError(f"Page {page_number} n'existe pas")
-            
-            page = pdf.pages[page_number]
-            
-            # Extraire les mots avec positions
-            words = page.extract_words(x_tolerance=3, y_tolerance=3)
-            
-            # Grouper par ligne
-            lines = self._group_by_lines(words)
-            
-            # Calibrer les colonnes sur cette page
-            self.columns = self._calibrate_columns_from_formula_line(lines)
-            
-            # Parser les lignes
-            rows, recap, raw_lines = self._parse_lines(lines)
-            
-            return SDPPage(
-                page_number=page_number,
-                rows=rows,
-                recap=recap,
-                raw_text_lines=raw_lines,
-            )
+
+            return self.extract_page_obj(pdf.pages[page_number], page_number)
+
+    def extract_page_obj(self, page, page_number: int) -> SDPPage:
+        """
+        Extrait les données d'une page pdfplumber déjà ouverte.
+
+        Permet à extract_all_pages de n'ouvrir le PDF qu'une seule fois au
+        lieu de re-parser xref et catalogue à chaque page.
+
+        Args:
+            page: Objet page pdfplumber
+            page_number: Numéro de page (0-based)
+
+        Returns:
+            SDPPage avec les données extraites
+        """
+        # Extraire les mots avec positions
+        words = page.extract_words(x_tolerance=3, y_tolerance=3)
+
+        # Grouper par ligne
+        lines = self._group_by_lines(words)
+
+        # Calibrer les colonnes sur cette page
+        self._set_columns(self._calibrate_columns_from_formula_line(lines))
+
+        # Parser les lignes
+        rows, recap, raw_lines = self._parse_lines(lines)
+
+        return SDPPage(
+            page_number=page_number,
+            rows=rows,
+            recap=recap,
+            raw_text_lines=raw_lines,
+        )
     
-    def _group_by_lines(self, words: List[dict]) -> List[Tuple[float, List[dict]]]:
-        """Groupe les mots par ligne (position Y)."""
+    def _set_columns(self, columns: List[Tuple[int, int, str, str]]) -> None:
+        """
+        Mémorise les colonnes calibrées et précalcule leurs centres.
+
+        Les colonnes sont triées par X croissant : la liste des centres l'est
+        aussi, ce qui permet une recherche bisect dans _parse_row.
+        """
+        self.columns = columns
+        self._col_centers = [(s + e) / 2 for s, e, _, _ in columns]
+
+    def _group_by_lines(self, words: List[dict]) -> List[Tuple[float, List[dict], str]]:
+        """
+        Groupe les mots par ligne (position Y).
+
+        Retourne des triplets (y, mots, texte) : le texte de la ligne est
+        joint une seule fois ici, au lieu d'être reconstruit par chaque
+        consommateur (calibration, détection d'en-tête, parsing du récap).
+        """
         lines = defaultdict(list)
         for w in words:
             y = round(w['top'] / 8) * 8  # Arrondir à 8px
             lines[y].append(w)
-        
+
         # Trier par Y puis par X dans chaque ligne
         sorted_lines = []
         for y in sorted(lines.keys()):
             line_words = sorted(lines[y], key=lambda w: w['x0'])
-            sorted_lines.append((y, line_words))
-        
+            text = " ".join(w['text'] for w in line_words)
+            sorted_lines.append((y, line_words, text))
+
         return sorted_lines
     
-    def _parse_lines(self, lines: List[Tuple[float, List[dict]]]) -> Tuple[List[SDPRow], Optional[SDPRecap], List[str]]:
+    def _parse_lines(self, lines: List[Tuple[float, List[dict], str]]) -> Tuple[List[SDPRow], Optional[SDPRecap], List[str]]:
         """Parse les lignes et extrait les données structurées."""
         rows = []
         recap = SDPRecap()
         raw_lines = []
-        
-        # Trouver le début du tableau (après la ligne "1=axb")
+
+        # Trouver le début du tableau (après la ligne "1=axb").
+        # "1=ax" couvre aussi "1=axb" : un seul balayage de sous-chaîne suffit
         table_start_idx = 0
-        for i, (y, line_words) in enumerate(lines):
-            text = " ".join(w['text'] for w in line_words)
-            raw_lines.append(text)
-            if "1=axb" in text or "1=ax" in text:
+        keep_raw = self.keep_raw_lines
+        for i, (y, line_words, text) in enumerate(lines):
+            if keep_raw:
+                raw_lines.append(text)
+            if "1=ax" in text:
                 table_start_idx = i + 1
                 break
-        
+
         # État du parsing
         in_main_table = True
         in_recap = False
-        
+
         # Parser les lignes
-        for y, line_words in lines[table_start_idx:]:
-            text = " ".join(w['text'] for w in line_words)
-            
+        for y, line_words, text in lines[table_start_idx:]:
             # Détecter TOTAL PRIX SECS (fin du tableau principal)
             if "TOTAL PRIX SECS" in text:
                 # Extraire les totaux
-                self._parse_total_prix_secs(line_words, recap)
+                self._parse_total_prix_secs(text, recap)
                 in_main_table = False
                 in_recap = True
                 continue
@@ -324,8 +409,11 @@ class SDPExtractor:
     
     def _parse_recap_line(self, text: str, recap: SDPRecap) -> None:
         """Parse une ligne du tableau récapitulatif."""
-        import re
-        
+        # Sortie rapide si la ligne ne contient aucun mot-clé du récap :
+        # évite de dérouler toute la chaîne de tests sur les lignes de bruit
+        if not _RECAP_KEY_RE.search(text):
+            return
+
         # TOTAL 5 et TOTAL 7
         if "TOTAL 5" in text:
             recap.total_5 = self._extract_amount(text, "TOTAL 5")
@@ -335,49 +423,46 @@ class SDPExtractor:
         elif "K1" in text and "Frais de chantier" in text:
             # Format: "K1 Frais de chantier, en % du total 5: 0,10 soit: 4 011,71€ K4..."
             recap.k1_pct = self._extract_pct_before_soit(text, first=True)
-            recap.k1_montant = self._extract_amount_after(text, "soit:")
             recap.k4_pct = self._extract_pct_before_soit(text, first=False)
-            recap.k4_montant = self._extract_amount_after_last(text, "soit:")
-        
+            recap.k1_montant, recap.k4_montant = self._amounts_after_soit(text)
+
         # K2 et K5 (Frais proportionnels)
         elif "K2" in text and "Frais proportionnels" in text:
             recap.k2_pct = self._extract_pct_before_soit(text, first=True)
-            recap.k2_montant = self._extract_amount_after(text, "soit:")
             recap.k5_pct = self._extract_pct_before_soit(text, first=False)
-            recap.k5_montant = self._extract_amount_after_last(text, "soit:")
-        
+            recap.k2_montant, recap.k5_montant = self._amounts_after_soit(text)
+
         # K3 et K6 (Aléas-Bénéfice)
         elif "K3" in text and ("Aléas" in text or "Aleas" in text):
             recap.k3_pct = self._extract_pct_before_soit(text, first=True)
-            recap.k3_montant = self._extract_amount_after(text, "soit:")
             recap.k6_pct = self._extract_pct_before_soit(text, first=False)
-            recap.k6_montant = self._extract_amount_after_last(text, "soit:")
+            recap.k3_montant, recap.k6_montant = self._amounts_after_soit(text)
         
         # Total A et Total B (format: "25% Total A 10 029,28€ 15% Total B 14 398,19")
         elif "Total A" in text or "Total B" in text:
             # Chercher pattern avec % avant Total
-            match_a = re.search(r'(\d+)\s*%\s*Total\s*A\s*([\d\s]+,\d+)', text, re.IGNORECASE)
+            match_a = _TOTAL_A_PCT_RE.search(text)
             if match_a:
                 recap.total_a_pct = match_a.group(1) + "%"
                 recap.total_a = self._clean_amount(match_a.group(2)) + " €"
             # Aussi chercher format "Total A XXX,XX €"
             elif "Total A" in text:
-                match = re.search(r'Total\s*A\s*([\d\s]+,\d+)', text, re.IGNORECASE)
+                match = _TOTAL_A_RE.search(text)
                 if match:
                     recap.total_a = self._clean_amount(match.group(1)) + " €"
-            
-            match_b = re.search(r'(\d+)\s*%\s*Total\s*B\s*([\d\s]+,\d+)', text, re.IGNORECASE)
+
+            match_b = _TOTAL_B_PCT_RE.search(text)
             if match_b:
                 recap.total_b_pct = match_b.group(1) + "%"
                 recap.total_b = self._clean_amount(match_b.group(2)) + " €"
             elif "Total B" in text:
-                match = re.search(r'Total\s*B\s*([\d\s]+,\d+)', text, re.IGNORECASE)
+                match = _TOTAL_B_RE.search(text)
                 if match:
                     recap.total_b = self._clean_amount(match.group(1)) + " €"
         
         # Prix de vente HT (format: "PRIX DE VENTE HORS TAXES ( (A) + (B) ): XXX,XX Arrondi à: XXX,XX €")
         elif "PRIX DE VENTE" in text or "Arrondi" in text:
-            amounts = re.findall(r'[\d\s]+,\d+\s*€?', text)
+            amounts = _AMOUNT_RE.findall(text)
             if amounts:
                 recap.prix_vente_ht = self._clean_amount(amounts[0]) + " €"
                 if len(amounts) > 1:
@@ -387,7 +472,6 @@ class SDPExtractor:
     
     def _extract_pct_before_soit(self, text: str, first: bool = True) -> str:
         """Extrait le pourcentage avant 'soit:' (premier ou dernier)."""
-        import re
         # Chercher tous les patterns "X,XX soit:" ou "XX% soit:"
         parts = text.split("soit:")
         if first and len(parts) >= 1:
@@ -398,7 +482,7 @@ class SDPExtractor:
             return ""
         
         # Chercher le pourcentage ou la valeur décimale
-        match = re.search(r'(\d+(?:,\d+)?)\s*%?\s*$', before.strip())
+        match = _PCT_RE.search(before.strip())
         if match:
             val = match.group(1)
             # Convertir 0,10 en 10%
@@ -413,68 +497,61 @@ class SDPExtractor:
     
     def _clean_amount(self, amount: str) -> str:
         """Nettoie un montant en supprimant les espaces internes."""
-        import re
         if not amount:
             return ""
-        # Supprimer tous les espaces autour de la virgule
-        cleaned = re.sub(r'\s*,\s*', ',', amount)
-        # Supprimer les espaces entre les chiffres (ex: "40 117" -> "40117")
-        cleaned = re.sub(r'(\d)\s+(\d)', r'\1\2', cleaned)
-        # S'assurer qu'il y a un espace avant € si présent
-        cleaned = re.sub(r'(\d)€', r'\1 €', cleaned)
-        return cleaned.strip()
+        # Une seule passe au lieu de trois re.sub : virgules recollées
+        # (", " -> ","), espaces de milliers supprimés ("40 117" -> "40117"),
+        # espace inséré avant € ("12€" -> "12 €")
+        return _CLEAN_AMOUNT_RE.sub(_clean_amount_repl, amount).strip()
     
-    def _parse_total_prix_secs(self, line_words: List[dict], recap: SDPRecap) -> None:
+    def _parse_total_prix_secs(self, text: str, recap: SDPRecap) -> None:
         """Extrait les totaux de la ligne TOTAL PRIX SECS."""
-        text = " ".join(w['text'] for w in line_words)
-        import re
         # Chercher les montants dans le texte
-        amounts = re.findall(r'[\d\s]+,\d+\s*€?', text)
+        amounts = _AMOUNT_RE.findall(text)
         if len(amounts) >= 2:
             recap.total_5 = self._clean_amount(amounts[0])
             recap.total_7 = self._clean_amount(amounts[1])
     
     def _extract_amount(self, text: str, marker: str) -> str:
         """Extrait un montant après un marqueur."""
-        import re
-        idx = text.find(marker)
-        if idx >= 0:
-            after = text[idx + len(marker):]
-            match = re.search(r'[\d\s]+,\d+\s*€?', after)
-            if match:
-                return self._clean_amount(match.group())
-        return ""
-    
-    def _extract_amount_after(self, text: str, marker: str) -> str:
-        """Extrait le premier montant après un marqueur."""
-        import re
         idx = text.find(marker)
         if idx >= 0:
             after = text[idx + len(marker):]
-            match = re.search(r'[\d\s]+,\d+\s*€?', after)
-            if match:
-                return self._clean_amount(match.group())
-        return ""
-    
-    def _extract_amount_after_last(self, text: str, marker: str) -> str:
-        """Extrait le dernier montant après la dernière occurrence du marqueur."""
-        import re
-        idx = text.rfind(marker)
-        if idx >= 0:
-            after = text[idx + len(marker):]
-            match = re.search(r'[\d\s]+,\d+\s*€?', after)
+            match = _AMOUNT_RE.search(after)
             if match:
                 return self._clean_amount(match.group())
         return ""
-    
+
+    def _amounts_after_soit(self, text: str) -> Tuple[str, str]:
+        """
+        Montants suivant la première et la dernière occurrence de "soit:".
+
+        Les lignes K1/K4, K2/K5 et K3/K6 portent deux montants, chacun après
+        un "soit:". Une seule passe finditer remplace les deux balayages
+        complets de la ligne ; "soit:" se termine par ':', hors alphabet du
+        motif montant, donc aucun montant ne peut chevaucher le marqueur et
+        la sélection par position est exacte.
+        """
+        first = text.find("soit:")
+        if first < 0:
+            return "", ""
+        last = text.rfind("soit:")
+
+        first_amt = ""
+        for match in _AMOUNT_RE.finditer(text, first + 5):
+            if not first_amt:
+                first_amt = self._clean_amount(match.group())
+            if match.start() >= last + 5:
+                return first_amt, self._clean_amount(match.group())
+        return first_amt, ""
+
     def _extract_pct(self, text: str, after_marker: str) -> str:
         """Extrait un pourcentage juste avant un marqueur (ex: '10% soit:')."""
-        import re
         idx = text.find(after_marker)
         if idx >= 0:
             before = text[:idx]
             # Chercher un pourcentage ou un nombre décimal (0,10 = 10%)
-            match = re.search(r'(\d+(?:,\d+)?)\s*%?\s*$', before.strip())
+            match = _PCT_RE.search(before.strip())
             if match:
                 val = match.group(1)
                 # Convertir 0,10 en 10%
@@ -486,71 +563,14 @@ class SDPExtractor:
     
     def _extract_first_amount(self, text: str) -> str:
         """Extrait le premier montant du texte."""
-        import re
-        match = re.search(r'[\d\s]+,\d+\s*€?', text)
+        match = _AMOUNT_RE.search(text)
         return self._clean_amount(match.group()) if match else ""
-    
+
     def _extract_last_amount(self, text: str) -> str:
         """Extrait le dernier montant du texte."""
-        import re
-        matches = re.findall(r'[\d\s]+,\d+\s*€?', text)
+        matches = _AMOUNT_RE.findall(text)
         return self._clean_amount(matches[-1]) if matches else ""
     
-    def _group_words_by_proximity(self, line_words: List[dict], gap_threshold: float = 12.0) -> List[str]:
-        """
-        Groupe les mots par proximité X.
-        Les mots proches (gap < threshold) forment un seul groupe/valeur.
-        
-        Returns:
-            Liste de valeurs (groupes de mots) ordonnées de gauche à droite
-        """
-        if not line_words:
-            return []
-        
-        # Trier par position X
-        sorted_words = sorted(line_words, key=lambda w: w['x0'])
-        
-        groups = []
-        current_group = [sorted_words[0]['text']]
-        current_x1 = sorted_words[0]['x1']  # Position de fin du mot
-        
-        for word in sorted_words[1:]:
-            gap = word['x0'] - current_x1  # Espace entre les mots
-            
-            # Le symbole € doit toujours être collé au nombre précédent
-            if word['text'] == '€' and gap < 25:
-                current_group.append(word['text'])
-            elif gap < gap_threshold:
-                # Mot proche -> même groupe
-                current_group.append(word['text'])
-            else:
-                # Nouveau groupe
-                groups.append(" ".join(current_group))
-                current_group = [word['text']]
-            
-            current_x1 = word['x1']
-        
-        # Ajouter le dernier groupe
-        groups.append(" ".join(current_group))
-        
-        # Post-traitement: fusionner "- €" isolés
-        cleaned_groups = []
-        i = 0
-        while i < len(groups):
-            g = groups[i]
-            # Fusionner "-" suivi de "€"
-            if g == '-' and i + 1 < len(groups) and groups[i + 1] == '€':
-                cleaned_groups.append('- €')
-                i += 2
-            # Supprimer les "€" isolés (déjà attachés aux nombres)
-            elif g == '€':
-                i += 1
-            else:
-                cleaned_groups.append(g)
-                i += 1
-        
-        return cleaned_groups
-    
     def _parse_row(self, line_words: List[dict], row_type: str = "detail") -> Optional[SDPRow]:
         """Parse une ligne en SDPRow avec approche hybride position X + proximité."""
         if not line_words:
@@ -574,42 +594,47 @@ class SDPExtractor:
         if not groups_with_pos:
             return None
         
-        # Pour chaque groupe, trouver la colonne la plus proche
+        # Pour chaque groupe, trouver la colonne la plus proche.
+        # Les centres sont triés par X : le centre le plus proche est l'un
+        # des deux voisins du point d'insertion bisect — 2 comparaisons au
+        # lieu de 12 par groupe
+        centers = self._col_centers
+        n_cols = len(centers)
         for x_center, text in groups_with_pos:
-            # Trouver la colonne dont le centre est le plus proche
             best_col = None
             best_dist = float('inf')
-            
-            for x_start, x_end, col_name, _ in self.columns:
-                col_center = (x_start + x_end) / 2
-                dist = abs(x_center - col_center)
-                
-                # Vérifier aussi si le groupe est dans la plage de la colonne
-                in_range = x_start - 30 <= x_center <= x_end + 30
-                
-                if in_range and dist < best_dist:
-                    best_dist = dist
-                    best_col = col_name
-            
+
+            idx = bisect_left(centers, x_center)
+            for i in (idx - 1, idx):
+                if 0 <= i < n_cols:
+                    x_start, x_end, col_name, _ = self.columns[i]
+                    if x_start - 30 <= x_center <= x_end + 30:
+                        dist = abs(x_center - centers[i])
+                        if dist < best_dist:
+                            best_dist = dist
+                            best_col = col_name
+
+            if best_col is None:
+                # Aucun des deux voisins dans sa plage élargie (±30) : repli
+                # sur le balayage complet, une colonne plus lointaine peut
+                # encore contenir le groupe
+                for i, (x_start, x_end, col_name, _) in enumerate(self.columns):
+                    if x_start - 30 <= x_center <= x_end + 30:
+                        dist = abs(x_center - centers[i])
+                        if dist < best_dist:
+                            best_dist = dist
+                            best_col = col_name
+
             if best_col:
                 if col_values[best_col]:
                     col_values[best_col] += " " + text
                 else:
                     col_values[best_col] = text
         
+        # Les clés de col_values sont les noms internes des colonnes, qui
+        # correspondent aux champs de SDPRow : dépaquetage direct
         return SDPRow(
-            composantes_du_prix=col_values["composantes_du_prix"].strip(),
-            unite=col_values["unite"].strip(),
-            quantite=col_values["quantite"].strip(),
-            duree_utilisation=col_values["duree_utilisation"].strip(),
-            total=col_values["total"].strip(),
-            main_oeuvre_cout_unitaire=col_values["main_oeuvre_cout_unitaire"].strip(),
-            materiels_prix_unitaire=col_values["materiels_prix_unitaire"].strip(),
-            prestations_prix_unitaire=col_values["prestations_prix_unitaire"].strip(),
-            montant_part_propre=col_values["montant_part_propre"].strip(),
-            part_sous_traites_prix_unitaire=col_values["part_sous_traites_prix_unitaire"].strip(),
-            part_sous_traites_montant=col_values["part_sous_traites_montant"].strip(),
-            total_general=col_values["total_general"].strip(),
+            **{name: value.strip() for name, value in col_values.items()},
             row_type=row_type,
             indent_level=indent,
         )
@@ -668,11 +693,10 @@ class SDPExtractor:
         # Post-traitement: séparer les unités fusionnées avec la description
         # Si le dernier mot d'un groupe est une unité, le séparer
         final_groups = []
-        units = {'m', 'm2', 'm3', 'ml', 'h', 't', 'j', 'u', 'kg', 'l', 'ens', 'forf', 'km'}
-        
+
         for x, text in cleaned:
             words = text.split()
-            if len(words) > 1 and words[-1].lower() in units:
+            if len(words) > 1 and words[-1].lower() in _UNITS:
                 # Séparer l'unité
                 desc = " ".join(words[:-1])
                 unit = words[-1]
@@ -687,40 +711,108 @@ class SDPExtractor:
     
     def _is_unit_or_number(self, text: str) -> bool:
         """Vérifie si le texte est une unité ou un nombre."""
-        import re
         text = text.strip()
-        
+        if not text:
+            return False
+
         # Unités courantes
-        units = {'m', 'm2', 'm3', 'ml', 'h', 't', 'j', 'u', 'kg', 'l', 'ens', 'forf', 'km'}
-        if text.lower() in units:
+        if text.lower() in _UNITS:
             return True
-        
-        # Nombre (avec ou sans décimales, espaces comme séparateurs de milliers)
-        if re.match(r'^[\d\s]+([,\.]\d+)?(\s*€)?$', text):
+
+        # Nombre (avec ou sans décimales, espaces comme séparateurs de
+        # milliers). Le motif exige un chiffre en tête (texte déjà strippé) :
+        # inutile de lancer la regex sur une description
+        if text[0].isdigit() and _NUMBER_RE.match(text):
             return True
-        
+
         # Tiret seul (valeur vide/nulle)
-        if text == '-' or text == '- €':
-            return True
-        
-        return False
+        return text == '-' or text == '- €'
     
-    def extract_all_pages(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[SDPPage]:
-        """Extrait toutes les pages SDP d'un PDF."""
+    def extract_all_pages(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+        workers: int = 1,
+    ) -> List[SDPPage]:
+        """
+        Extrait toutes les pages SDP d'un PDF.
+
+        Args:
+            pdf_path: Chemin vers le PDF
+            pages: Indices de pages à extraire (None = toutes)
+            workers: Nombre de processus (1 = séquentiel). Le parsing
+                pdfminer est borné CPU et indépendant par page : avec
+                workers > 1 chaque processus traite une tranche contiguë
+                de pages avec sa propre ouverture du document.
+        """
+        if workers > 1:
+            return self._extract_all_pages_parallel(pdf_path, pages, workers)
+
+        return list(self.iter_pages(pdf_path, pages))
+
+    def iter_pages(self, pdf_path: Path, pages: Optional[List[int]] = None) -> Iterator[SDPPage]:
+        """
+        Extrait les pages SDP une par une (générateur paresseux).
+
+        Contrairement à extract_all_pages, une seule SDPPage est en mémoire
+        à la fois : utile pour streamer un gros document vers du JSON ligne
+        à ligne sans garder tous les raw_text_lines vivants.
+
+        Yields:
+            SDPPage, dans l'ordre des pages demandées
+        """
+        # Une seule ouverture du document : l'open pdfplumber (parse du xref
+        # et du catalogue) est le poste dominant quand il est répété par page
         with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-        
+            if pages is None:
+                pages = range(len(pdf.pages))
+
+            for page_num in pages:
+                try:
+                    if page_num >= len(pdf.pages):
+                        raise ValueError(f"Page {page_num} n'existe pas")
+                    page_data = self.extract_page_obj(pdf.pages[page_num], page_num)
+                except Exception as e:
+                    print(f"Erreur page {page_num + 1}: {e}")
+                    continue
+                yield page_data
+
+    def _extract_all_pages_parallel(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]],
+        workers: int,
+    ) -> List[SDPPage]:
+        """
+        Extraction parallèle : une tranche de pages par processus worker.
+
+        Les objets pdfplumber ne sont pas picklables, donc chaque worker
+        ré-ouvre le PDF pour sa tranche (une seule fois, pas par page).
+        executor.map sur des tranches contiguës préserve l'ordre des pages.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
         if pages is None:
-            pages = list(range(total_pages))
-        
+            with pdfplumber.open(pdf_path) as pdf:
+                pages = list(range(len(pdf.pages)))
+
+        # Pas plus de workers que de pages : inutile de payer le fork
+        # de processus qui ne recevront jamais de tâche
+        max_workers = min(workers, len(pages)) or 1
+        chunk_size = -(-len(pages) // max_workers)  # plafond entier
+        chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+
         results = []
-        for page_num in pages:
-            try:
-                page_data = self.extract_page(pdf_path, page_num)
-                results.append(page_data)
-            except Exception as e:
-                print(f"Erreur page {page_num + 1}: {e}")
-        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_results in executor.map(
+                _extract_sdp_pages_job, [str(pdf_path)] * len(chunks), chunks
+            ):
+                for page_num, page_data, error in chunk_results:
+                    if error:
+                        print(error)
+                    else:
+                        results.append(page_data)
+
         return results
     
     def to_dict(self, page: SDPPage) -> dict:
@@ -809,6 +901,27 @@ class SDPExtractor:
                 r.row_type,
                 str(r.indent_level),
             ])
-        
+
         return rows
 
+
+def _extract_sdp_pages_job(pdf_path: str, page_nums: List[int]) -> list:
+    """
+    Traite une tranche de pages dans un processus worker.
+
+    Fonction de niveau module (picklable). Le document est ouvert une seule
+    fois par worker. Retourne une liste de (page_num, SDPPage | None, erreur).
+    """
+    extractor = SDPExtractor()
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in page_nums:
+            try:
+                if page_num >= len(pdf.pages):
+                    raise ValueError(f"Page {page_num} n'existe pas")
+                page_data = extractor.extract_page_obj(pdf.pages[page_num], page_num)
+                results.append((page_num, page_data, None))
+            except Exception as e:
+                results.append((page_num, None, f"Erreur page {page_num + 1}: {e}"))
+    return results
+
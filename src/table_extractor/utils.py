@@ -10,7 +10,9 @@ from PIL import Image
 import json
 
 
-@dataclass
+# slots=True : les bbox sont allouées en masse (une par détection, par table
+# pdfplumber et par paire candidate à la fusion), pas de __dict__ par instance
+@dataclass(slots=True)
 class BoundingBox:
     """Représente une boîte englobante"""
     x1: float
@@ -50,7 +52,9 @@ class BoundingBox:
         return (self.x1, self.y1, self.x2, self.y2)
 
 
-@dataclass
+# slots=True : pas de __dict__ par cellule (il peut y en avoir des milliers
+# par document), accès aux attributs plus rapide
+@dataclass(slots=True)
 class TableCell:
     """Représente une cellule de tableau"""
     row: int
@@ -73,7 +77,9 @@ class TableCell:
         return result
 
 
-@dataclass
+# slots=True supprime le __dict__ par instance (~2x moins de mémoire par
+# tableau, sensible sur les gros PDF)
+@dataclass(slots=True)
 class ExtractedTable:
     """Représente un tableau extrait"""
     page_number: int
@@ -84,6 +90,21 @@ class ExtractedTable:
     num_cols: int = 0
     raw_data: List[List[str]] = field(default_factory=list)
     
+    def iter_cells(self):
+        """
+        Itère sur les cellules du tableau.
+
+        Si la liste cells n'a pas été matérialisée (cas usuel : elle dupliquerait
+        raw_data), les TableCell sont générées à la volée depuis raw_data —
+        aucune raison de garder 2x N x M objets Python en mémoire.
+        """
+        if self.cells:
+            yield from self.cells
+            return
+        for row_idx, row in enumerate(self.raw_data):
+            for col_idx, content in enumerate(row):
+                yield TableCell(row=row_idx, col=col_idx, content=content or "")
+
     def to_dict(self) -> dict:
         return {
             "page_number": self.page_number,
@@ -91,7 +112,7 @@ class ExtractedTable:
             "bbox": self.bbox.to_dict(),
             "num_rows": self.num_rows,
             "num_cols": self.num_cols,
-            "cells": [cell.to_dict() for cell in self.cells],
+            "cells": [cell.to_dict() for cell in self.iter_cells()],
             "raw_data": self.raw_data
         }
     
@@ -106,15 +127,20 @@ class ExtractedTable:
     
     def to_csv(self, path: Union[str, Path]) -> None:
         """Exporte en CSV"""
-        df = self.to_dataframe()
-        df.to_csv(path, index=False, encoding='utf-8-sig')
+        import csv
+
+        # csv.writer directement sur raw_data (déjà une liste de listes) :
+        # évite de construire un DataFrame pandas par tableau pour le jeter
+        # aussitôt. Sortie identique (quoting minimal, lignes en \n)
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f, lineterminator='\n').writerows(self.raw_data)
     
     def to_json(self) -> str:
         """Exporte en JSON"""
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
-@dataclass 
+@dataclass(slots=True)
 class ExtractionResult:
     """Résultat complet d'une extraction"""
     pdf_path: str
@@ -134,7 +160,20 @@ class ExtractionResult:
     def save_json(self, path: Union[str, Path]) -> None:
         """Sauvegarde le résultat en JSON"""
         import numpy as np
-        
+
+        # orjson (Rust) si disponible : 5-10x plus rapide que json pour les
+        # gros raw_data, et sérialise les scalaires numpy nativement
+        try:
+            import orjson
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                ))
+            return
+        except ImportError:
+            pass
+
         def convert_types(obj):
             """Convertit les types numpy en types Python natifs"""
             if isinstance(obj, dict):
@@ -152,6 +191,29 @@ class ExtractionResult:
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(convert_types(self.to_dict()), f, ensure_ascii=False, indent=2)
     
+    def save_parquet(self, path: Union[str, Path]) -> None:
+        """
+        Sauvegarde tous les tableaux dans un seul fichier parquet.
+
+        Format long : colonnes (page, table_index, row, col, content). Un seul
+        fichier écrit par le writer C++ d'Arrow, au lieu d'un CSV pandas par
+        tableau — nettement plus rapide quand il y a beaucoup de tableaux.
+        Nécessite pyarrow (ou fastparquet).
+        """
+        import pandas as pd
+
+        records = [
+            (table.page_number, table.table_index, r, c, value)
+            for table in self.tables
+            for r, row in enumerate(table.raw_data)
+            for c, value in enumerate(row)
+        ]
+        df = pd.DataFrame(
+            records,
+            columns=["page", "table_index", "row", "col", "content"],
+        )
+        df.to_parquet(path, index=False)
+
     def save_all_csv(self, output_dir: Union[str, Path]) -> List[Path]:
         """Sauvegarde tous les tableaux en CSV"""
         output_dir = Path(output_dir)
@@ -167,36 +229,117 @@ class ExtractionResult:
         return saved_files
 
 
-def pdf_to_images(pdf_path: Union[str, Path], dpi: int = 200) -> List[Image.Image]:
+def pdf_to_images(
+    pdf_path: Union[str, Path],
+    dpi: int = 200,
+    grayscale: bool = False,
+) -> List[Image.Image]:
     """
     Convertit un PDF en liste d'images PIL
-    
+
+    Matérialise toutes les pages : préférer iter_pdf_images pour les gros PDF
+    quand les pages peuvent être traitées une par une.
+
     Args:
         pdf_path: Chemin vers le fichier PDF
         dpi: Résolution en DPI (défaut: 200)
-        
+        grayscale: Rendre en niveaux de gris (mode L, 3x moins de mémoire)
+
     Returns:
         Liste d'images PIL, une par page
     """
+    return [
+        image
+        for _, image in iter_pdf_images(pdf_path, dpi=dpi, grayscale=grayscale)
+    ]
+
+
+def iter_pdf_images(
+    pdf_path: Union[str, Path],
+    dpi: int = 200,
+    pages: Optional[List[int]] = None,
+    grayscale: bool = False,
+):
+    """
+    Rend les pages d'un PDF une par une (générateur paresseux).
+
+    Contrairement à pdf_to_images, une seule page est en mémoire à la fois :
+    indispensable pour les gros PDF (une page A4 à 200 DPI pèse ~17 Mo en RGB,
+    ~6 Mo en niveaux de gris).
+
+    Args:
+        pdf_path: Chemin vers le fichier PDF
+        dpi: Résolution en DPI (défaut: 200)
+        pages: Indices de pages à rendre (None = toutes)
+        grayscale: Rendre en niveaux de gris — PDFium rastérise directement
+            en un canal (mode L), sans passer par un tampon RGB intermédiaire
+
+    Yields:
+        Tuples (index_page, image PIL)
+    """
     import pypdfium2 as pdfium
-    
+
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF non trouvé: {pdf_path}")
-    
+
     pdf = pdfium.PdfDocument(str(pdf_path))
-    images = []
-    
-    scale = dpi / 72  # 72 DPI est la résolution de base PDF
-    
-    for page_index in range(len(pdf)):
+    scale = dpi / 72
+    try:
+        page_indices = range(len(pdf)) if pages is None else pages
+        for page_index in page_indices:
+            if page_index >= len(pdf):
+                continue
+            # rev_byteorder : PDFium produit directement l'ordre d'octets de
+            # PIL (RGB au lieu de BGR), to_pil() évite l'inversion de canaux
+            bitmap = pdf[page_index].render(
+                scale=scale, grayscale=grayscale, rev_byteorder=True
+            )
+            yield page_index, bitmap.to_pil()
+    finally:
+        pdf.close()
+
+
+def pdf_page_to_image(
+    pdf_path: Union[str, Path],
+    page_index: int,
+    dpi: int = 200,
+    grayscale: bool = False,
+) -> Image.Image:
+    """
+    Rend une seule page d'un PDF en image PIL.
+
+    Args:
+        pdf_path: Chemin vers le fichier PDF
+        page_index: Index de la page (0-based)
+        dpi: Résolution en DPI (défaut: 200)
+        grayscale: Rendre en niveaux de gris (mode L, 3x moins de mémoire)
+
+    Returns:
+        Image PIL de la page
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
         page = pdf[page_index]
-        bitmap = page.render(scale=scale)
-        pil_image = bitmap.to_pil()
-        images.append(pil_image)
-    
-    pdf.close()
-    return images
+        bitmap = page.render(
+            scale=dpi / 72, grayscale=grayscale, rev_byteorder=True
+        )
+        return bitmap.to_pil()
+    finally:
+        pdf.close()
+
+
+def pdf_page_count(pdf_path: Union[str, Path]) -> int:
+    """Retourne le nombre de pages d'un PDF (sans rendu)."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
 
 
 def crop_image(image: Image.Image, bbox: BoundingBox, padding: int = 5) -> Image.Image:
@@ -25,7 +25,8 @@ except ImportError:
 from .utils import BoundingBox
 
 
-@dataclass
+# slots=True : une ColorBand par plage de couleur détectée sur chaque page
+@dataclass(slots=True)
 class ColorBand:
     """Une bande de couleur horizontale détectée."""
     y_start: int
@@ -41,7 +42,7 @@ class ColorBand:
         return (self.y_start + self.y_end) // 2
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRegion:
     """Région de tableau détectée par analyse visuelle."""
     x1: int
@@ -73,19 +74,26 @@ class VisualGuide:
         blue_threshold: Tuple[int, int, int] = (180, 200, 255),  # HSV bleu clair
         min_band_height: int = 10,
         min_table_rows: int = 3,
+        band_downsample: int = 4,
     ):
         """
         Args:
             blue_threshold: Seuil pour détecter le bleu (HSV)
             min_band_height: Hauteur minimale d'une bande de couleur
             min_table_rows: Nombre minimum de lignes pour un tableau
+            band_downsample: Facteur de sous-échantillonnage de l'image pour
+                la détection de bandes (1 = pleine résolution). La passe est
+                limitée par la bande passante mémoire et les bandes font des
+                dizaines de pixels : un facteur 4 divise le coût d'autant au
+                prix d'une quantification des Y à 4 pixels près
         """
         if cv2 is None:
             raise ImportError("opencv-python est requis. Installez-le avec: pip install opencv-python")
-        
+
         self.blue_threshold = blue_threshold
         self.min_band_height = min_band_height
         self.min_table_rows = min_table_rows
+        self.band_downsample = band_downsample
     
     def analyze_page(self, image: Image.Image) -> List[TableRegion]:
         """
@@ -106,20 +114,42 @@ class VisualGuide:
         else:  # RGB
             img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
         
-        # Détecter les bandes colorées
-        bands = self._detect_color_bands(img_bgr)
-        
+        # Détecter les bandes colorées, éventuellement sur une image réduite
+        height, width = img_bgr.shape[:2]
+        scale = self.band_downsample
+        if scale > 1 and height >= scale * self.min_band_height and width >= scale:
+            small = cv2.resize(
+                img_bgr,
+                (width // scale, height // scale),
+                interpolation=cv2.INTER_AREA,
+            )
+            bands = self._detect_color_bands(small, min_band_height=max(1, self.min_band_height // scale))
+            # Ramener les bandes aux coordonnées pleine résolution
+            bands = [
+                ColorBand(y_start=b.y_start * scale, y_end=b.y_end * scale, color=b.color)
+                for b in bands
+            ]
+        else:
+            bands = self._detect_color_bands(img_bgr)
+
         # Grouper les bandes en régions de tableau
-        regions = self._group_bands_to_tables(bands, img_bgr.shape[1], img_bgr.shape[0])
-        
+        regions = self._group_bands_to_tables(bands, width, height)
+
         return regions
     
-    def _detect_color_bands(self, img_bgr: np.ndarray) -> List[ColorBand]:
+    def _detect_color_bands(self, img_bgr: np.ndarray, min_band_height: Optional[int] = None) -> List[ColorBand]:
         """
         Détecte les bandes horizontales de couleur.
-        
+
         Cherche l'alternance blanc/bleu typique des tableaux.
+
+        Args:
+            img_bgr: Image BGR à analyser
+            min_band_height: Hauteur minimale d'une bande, dans l'échelle de
+                l'image fournie (défaut : self.min_band_height)
         """
+        if min_band_height is None:
+            min_band_height = self.min_band_height
         height, width = img_bgr.shape[:2]
         
         # Convertir en HSV pour mieux détecter les couleurs
@@ -136,49 +166,28 @@ class VisualGuide:
         upper_gray = np.array([180, 30, 240])
         mask_gray = cv2.inRange(img_hsv, lower_gray, upper_gray)
         
-        # Analyser ligne par ligne pour détecter les bandes
-        bands = []
-        current_band = None
-        
-        for y in range(height):
-            # Calculer le pourcentage de pixels bleus/gris sur cette ligne
-            row_blue = np.sum(mask_blue[y, :]) / (width * 255)
-            row_gray = np.sum(mask_gray[y, :]) / (width * 255)
-            
-            # Seuil pour considérer la ligne comme colorée
-            is_blue = row_blue > 0.3
-            is_gray = row_gray > 0.5 and not is_blue
-            is_white = not is_blue and not is_gray
-            
-            if is_blue:
-                color = "blue"
-            elif is_gray:
-                color = "gray"
-            else:
-                color = "white"
-            
-            # Grouper en bandes
-            if current_band is None:
-                current_band = {"y_start": y, "color": color}
-            elif current_band["color"] != color:
-                # Fin de la bande précédente
-                if y - current_band["y_start"] >= self.min_band_height:
-                    bands.append(ColorBand(
-                        y_start=current_band["y_start"],
-                        y_end=y,
-                        color=current_band["color"]
-                    ))
-                current_band = {"y_start": y, "color": color}
-        
-        # Dernière bande
-        if current_band and height - current_band["y_start"] >= self.min_band_height:
-            bands.append(ColorBand(
-                y_start=current_band["y_start"],
-                y_end=height,
-                color=current_band["color"]
-            ))
-        
-        return bands
+        # Fraction de pixels bleus/gris par ligne : réduction SIMD d'OpenCV
+        # (cv2.reduce, ~10x plus rapide que mask.sum(axis=1) sur uint8 ;
+        # la somme d'une ligne tient largement dans un int32)
+        denom = width * 255
+        row_blue = cv2.reduce(mask_blue, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() / denom
+        row_gray = cv2.reduce(mask_gray, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() / denom
+        is_blue_rows = row_blue > 0.3
+        is_gray_rows = (row_gray > 0.5) & ~is_blue_rows
+
+        # Codes couleur par ligne, puis détection des bandes par longueurs de
+        # plage (np.diff) au lieu d'une machine à états Python ligne par ligne
+        codes = np.where(is_blue_rows, 2, np.where(is_gray_rows, 1, 0))
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [height]))
+
+        color_names = ("white", "gray", "blue")
+        return [
+            ColorBand(y_start=int(s), y_end=int(e), color=color_names[codes[s]])
+            for s, e in zip(starts, ends)
+            if e - s >= min_band_height
+        ]
     
     def _group_bands_to_tables(
         self,
@@ -235,12 +244,10 @@ class VisualGuide:
         # Positions des lignes = centres des bandes
         row_positions = [band.center_y for band in bands]
         
-        # Confidence basée sur le nombre de lignes alternées
-        alternating_count = sum(
-            1 for i in range(1, len(bands))
-            if bands[i].color != bands[i-1].color
-        )
-        confidence = min(1.0, alternating_count / (len(bands) - 1)) if len(bands) > 1 else 0.5
+        # _group_bands_to_tables garantit l'alternance stricte au sein d'un
+        # groupe (toute répétition de couleur le clôt) : le ratio de bandes
+        # alternées vaut toujours 1, inutile de le recompter
+        confidence = 1.0 if len(bands) > 1 else 0.5
         
         return TableRegion(
             x1=0,
@@ -276,22 +283,45 @@ class VisualGuide:
         
         if not detr_boxes:
             return [r.to_bbox() for r in visual_regions]
-        
+
+        # Matrice IoU N bboxes x M régions en une passe NumPy (broadcasting),
+        # plus test « centre dans la région », au lieu d'une double boucle
+        # Python par paire (même schéma que le NMS du détecteur)
+        boxes = np.array([(b.x1, b.y1, b.x2, b.y2) for b in detr_boxes], dtype=np.float64)
+        regs = np.array([(r.x1, r.y1, r.x2, r.y2) for r in visual_regions], dtype=np.float64)
+
+        ix1 = np.maximum(boxes[:, None, 0], regs[None, :, 0])
+        iy1 = np.maximum(boxes[:, None, 1], regs[None, :, 1])
+        ix2 = np.minimum(boxes[:, None, 2], regs[None, :, 2])
+        iy2 = np.minimum(boxes[:, None, 3], regs[None, :, 3])
+        inter = np.clip(ix2 - ix1, 0, None) * np.clip(iy2 - iy1, 0, None)
+
+        box_areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        reg_areas = (regs[:, 2] - regs[:, 0]) * (regs[:, 3] - regs[:, 1])
+        union = box_areas[:, None] + reg_areas[None, :] - inter
+        iou = np.zeros_like(inter)
+        np.divide(inter, union, out=iou, where=union > 0)
+
+        centers_x = (boxes[:, 0] + boxes[:, 2]) / 2
+        centers_y = (boxes[:, 1] + boxes[:, 3]) / 2
+        inside = (
+            (regs[None, :, 0] <= centers_x[:, None]) & (centers_x[:, None] <= regs[None, :, 2])
+            & (regs[None, :, 1] <= centers_y[:, None]) & (centers_y[:, None] <= regs[None, :, 3])
+        )
+        overlap_mask = (iou > iou_threshold) | inside
+
         merged = []
         used_detr = set()
-        
-        for region in visual_regions:
-            # Trouver les bboxes DETR qui chevauchent cette région
+
+        for j, region in enumerate(visual_regions):
+            # Bboxes DETR non encore consommées qui chevauchent cette région
             overlapping = []
-            for i, box in enumerate(detr_boxes):
+            for i in np.nonzero(overlap_mask[:, j])[0]:
                 if i in used_detr:
                     continue
-                
-                iou = self._compute_iou(box, region)
-                if iou > iou_threshold or self._is_inside(box, region):
-                    overlapping.append((i, box))
-                    used_detr.add(i)
-            
+                overlapping.append((i, detr_boxes[i]))
+                used_detr.add(i)
+
             if overlapping:
                 # Fusionner toutes les bboxes qui chevauchent cette région
                 x1 = min(box.x1 for _, box in overlapping)
@@ -320,31 +350,4 @@ class VisualGuide:
                 merged.append(box)
         
         return merged
-    
-    def _compute_iou(self, box: BoundingBox, region: TableRegion) -> float:
-        """Calcule l'IoU entre une bbox et une région."""
-        x1 = max(box.x1, region.x1)
-        y1 = max(box.y1, region.y1)
-        x2 = min(box.x2, region.x2)
-        y2 = min(box.y2, region.y2)
-        
-        if x2 < x1 or y2 < y1:
-            return 0.0
-        
-        intersection = (x2 - x1) * (y2 - y1)
-        
-        box_area = (box.x2 - box.x1) * (box.y2 - box.y1)
-        region_area = (region.x2 - region.x1) * (region.y2 - region.y1)
-        union = box_area + region_area - intersection
-        
-        return intersection / union if union > 0 else 0.0
-    
-    def _is_inside(self, box: BoundingBox, region: TableRegion) -> bool:
-        """Vérifie si la bbox est majoritairement à l'intérieur de la région."""
-        # Vérifier si le centre de la bbox est dans la région
-        center_x = (box.x1 + box.x2) / 2
-        center_y = (box.y1 + box.y2) / 2
-        
-        return (region.x1 <= center_x <= region.x2 and
-                region.y1 <= center_y <= region.y2)
 
@@ -15,10 +15,14 @@ print("="*70)
 print("TEST ROBUSTESSE SDP - PAGES 18-19")
 print("="*70)
 
-# Extraire pages 18 et 19 (index 17 et 18)
+# Extraire pages 18 et 19 (index 17 et 18) en une seule passe : le PDF
+# n'est ouvert qu'une fois et chaque page n'est extraite qu'une fois
+# (l'affichage et la sauvegarde JSON réutilisent le même résultat)
+pages = {p.page_number: p for p in extractor.iter_pages(pdf_path, pages=[17, 18])}
+
 for page_idx in [17, 18]:
-    page_data = extractor.extract_page(pdf_path, page_number=page_idx)
-    
+    page_data = pages[page_idx]
+
     print(f"\n{'='*70}")
     print(f"PAGE {page_idx + 1}")
     print(f"{'='*70}")
@@ -56,8 +60,7 @@ for page_idx in [17, 18]:
 
 # Sauvegarder les détails
 for page_idx in [17, 18]:
-    page_data = extractor.extract_page(pdf_path, page_number=page_idx)
-    result = extractor.to_dict(page_data)
+    result = extractor.to_dict(pages[page_idx])
     json_path = output_dir / f'page{page_idx + 1}_test.json'
     with open(json_path, 'w', encoding='utf-8') as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,114 @@
+"""
+Fixtures partagées de la suite de tests.
+
+Le rendu des pages PDF et la construction des pipelines dominent le temps
+de la suite : les fixtures de session ne rastérisent le PDF de test
+qu'une seule fois et réutilisent les mêmes pipelines entre les tests
+(une extraction ne laisse pas d'état dépendant du document).
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ajouter src au path (avant l'import des modules testés)
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+TEST_PDF = Path(__file__).parent / "data_test" / "pdf_tables" / "test1.pdf"
+
+
+@pytest.fixture(scope="session")
+def test_pdf_path() -> Path:
+    """Chemin du PDF de test (skip si le fichier est absent)."""
+    if not TEST_PDF.exists():
+        pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
+    return TEST_PDF
+
+
+@pytest.fixture(scope="session")
+def test_pdf_images(test_pdf_path):
+    """
+    Pages du PDF de test rendues une seule fois pour toute la session.
+
+    72 DPI suffisent : les consommateurs vérifient le format des images et
+    l'invariant des bboxes du détecteur, pas le contenu — et la surface de
+    pixels (donc l'inférence CNN du détecteur) croît avec le carré du DPI.
+    """
+    from table_extractor.utils import pdf_to_images
+
+    return pdf_to_images(test_pdf_path, dpi=72)
+
+
+def _heavy_fingerprint(pdf_path: Path, test_file: Path) -> str:
+    """Empreinte du PDF testé, du code du paquet et du fichier de test."""
+    h = hashlib.sha256(pdf_path.read_bytes())
+    src_dir = Path(__file__).parent.parent / "src" / "table_extractor"
+    for py_file in sorted(src_dir.glob("*.py")):
+        h.update(py_file.read_bytes())
+    # Le fichier de test fait partie des entrées : un changement de config
+    # (pages, DPI...) doit relancer le test
+    h.update(test_file.read_bytes())
+    return h.hexdigest()
+
+
+@pytest.fixture
+def skip_if_last_passed(request):
+    """
+    Saute un test d'intégration lourd si ni le PDF ni le code n'ont changé
+    depuis son dernier passage au vert (cache pytest intégré).
+
+    L'empreinte couvre tous les modules de src/table_extractor, pas
+    seulement le pipeline : toute modification du code relance le test.
+    Forçage : PYTEST_FORCE_HEAVY=1 ou pytest --cache-clear.
+
+    Usage : mark_passed = skip_if_last_passed(pdf_path) en début de test,
+    puis mark_passed() après les assertions.
+    """
+    def check(pdf_path: Path):
+        if os.environ.get("PYTEST_FORCE_HEAVY"):
+            return lambda: None
+        key = "heavy_pass/" + request.node.name
+        fingerprint = _heavy_fingerprint(pdf_path, Path(request.node.fspath))
+        if request.config.cache.get(key, None) == fingerprint:
+            pytest.skip(
+                "PDF et code inchangés depuis le dernier passage "
+                "(PYTEST_FORCE_HEAVY=1 pour forcer)"
+            )
+        return lambda: request.config.cache.set(key, fingerprint)
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def pipeline_fast():
+    """Pipeline en mode fast, partagé entre les tests."""
+    from table_extractor import TableExtractionPipeline
+    from table_extractor.pipeline import PipelineConfig, ExtractionMode
+
+    config = PipelineConfig(
+        mode=ExtractionMode.FAST,
+        ocr_engine="tesseract",
+        dpi=150,
+        pages=[0],  # Première page seulement
+        save_images=False,
+    )
+    return TableExtractionPipeline(config)
+
+
+@pytest.fixture(scope="session")
+def pipeline_accurate():
+    """Pipeline en mode accurate, partagé entre les tests."""
+    from table_extractor import TableExtractionPipeline
+    from table_extractor.pipeline import PipelineConfig, ExtractionMode
+
+    config = PipelineConfig(
+        mode=ExtractionMode.ACCURATE,
+        ocr_engine="tesseract",
+        dpi=150,
+        pages=[0],
+        save_images=False,
+    )
+    return TableExtractionPipeline(config)
@@ -11,13 +11,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from table_extractor import TableExtractionPipeline, TableDetector, TableStructureExtractor
 from table_extractor.pipeline import PipelineConfig, ExtractionMode
-from table_extractor.utils import BoundingBox, ExtractedTable, pdf_to_images
+from table_extractor.utils import BoundingBox, ExtractedTable
 
 
 # Chemins des fichiers de test
 TEST_PDF = Path(__file__).parent / "data_test" / "pdf_tables" / "test1.pdf"
 UPLOAD_DIR = Path(__file__).parent.parent / "data" / "upload"
-OUTPUT_DIR = Path(__file__).parent.parent / "data" / "output"
 
 
 class TestUtils:
@@ -40,15 +39,10 @@ class TestUtils:
         assert d["x1"] == 10
         assert d["confidence"] == 0.95
     
-    def test_pdf_to_images(self):
-        """Test de la conversion PDF -> images"""
-        if not TEST_PDF.exists():
-            pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
-        
-        images = pdf_to_images(TEST_PDF, dpi=100)
-        
-        assert len(images) > 0
-        assert images[0].mode in ("RGB", "RGBA")
+    def test_pdf_to_images(self, test_pdf_images):
+        """Test de la conversion PDF -> images (rendu partagé de session)"""
+        assert len(test_pdf_images) > 0
+        assert test_pdf_images[0].mode in ("RGB", "RGBA")
 
 
 class TestTableDetector:
@@ -65,15 +59,10 @@ class TestTableDetector:
         assert detector.config is not None
         assert detector.config.confidence_threshold == 0.5
     
-    def test_detect_on_test_pdf(self, detector):
+    def test_detect_on_test_pdf(self, detector, test_pdf_images):
         """Test de détection sur le PDF de test"""
-        if not TEST_PDF.exists():
-            pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
-        
-        images = pdf_to_images(TEST_PDF, dpi=150)
-        
-        # Tester sur la première page
-        detections = detector.detect(images[0])
+        # Tester sur la première page (rendue une seule fois par session)
+        detections = detector.detect(test_pdf_images[0])
         
         # Vérifier le format des résultats
         assert isinstance(detections, list)
@@ -113,116 +102,89 @@ class TestTableStructureExtractor:
 
 
 class TestPipeline:
-    """Tests du pipeline complet"""
-    
-    @pytest.fixture
-    def pipeline_fast(self):
-        """Pipeline en mode fast"""
-        config = PipelineConfig(
-            mode=ExtractionMode.FAST,
-            ocr_engine="tesseract",
-            dpi=150,
-            pages=[0],  # Première page seulement
-            save_images=False,
-        )
-        return TableExtractionPipeline(config)
-    
-    @pytest.fixture
-    def pipeline_accurate(self):
-        """Pipeline en mode accurate"""
-        config = PipelineConfig(
-            mode=ExtractionMode.ACCURATE,
-            ocr_engine="tesseract",
-            dpi=150,
-            pages=[0],
-            save_images=False,
-        )
-        return TableExtractionPipeline(config)
-    
-    def test_pipeline_fast_mode(self, pipeline_fast):
+    """
+    Tests du pipeline complet (pipelines partagés, voir conftest.py).
+
+    Une seule extraction par mode : les fixtures de classe mutualisent le
+    passage rastérisation + détection, chaque test vérifie une propriété
+    différente du même résultat.
+    """
+
+    @pytest.fixture(scope="class")
+    def fast_extraction(self, pipeline_fast, test_pdf_path, tmp_path_factory):
+        """Extraction fast exécutée une fois, avec répertoire de sortie."""
+        output_dir = tmp_path_factory.mktemp("pipeline_fast")
+        return pipeline_fast.extract(test_pdf_path, output_dir=output_dir), output_dir
+
+    @pytest.fixture(scope="class")
+    def accurate_extraction(self, pipeline_accurate, test_pdf_path):
+        """Extraction accurate exécutée une fois."""
+        return pipeline_accurate.extract(test_pdf_path)
+
+    def test_pipeline_fast_mode(self, fast_extraction, test_pdf_path):
         """Test du pipeline en mode fast"""
-        if not TEST_PDF.exists():
-            pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
-        
-        result = pipeline_fast.extract(TEST_PDF)
-        
+        result, _ = fast_extraction
+
         assert result is not None
-        assert result.pdf_path == str(TEST_PDF)
+        assert result.pdf_path == str(test_pdf_path)
         assert isinstance(result.tables, list)
-    
-    def test_pipeline_accurate_mode(self, pipeline_accurate):
+
+    def test_pipeline_accurate_mode(self, accurate_extraction, test_pdf_path):
         """Test du pipeline en mode accurate"""
-        if not TEST_PDF.exists():
-            pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
-        
-        result = pipeline_accurate.extract(TEST_PDF)
-        
-        assert result is not None
-        assert result.pdf_path == str(TEST_PDF)
-    
-    def test_pipeline_with_output(self, pipeline_fast, tmp_path):
+        assert accurate_extraction is not None
+        assert accurate_extraction.pdf_path == str(test_pdf_path)
+
+    def test_pipeline_with_output(self, fast_extraction, test_pdf_path):
         """Test du pipeline avec sauvegarde"""
-        if not TEST_PDF.exists():
-            pytest.skip(f"Fichier de test non trouvé: {TEST_PDF}")
-        
-        result = pipeline_fast.extract(TEST_PDF, output_dir=tmp_path)
-        
+        result, output_dir = fast_extraction
+
         # Vérifier que le JSON a été créé
-        output_subdir = tmp_path / TEST_PDF.stem
+        output_subdir = output_dir / test_pdf_path.stem
         if result.tables:
             assert (output_subdir / "tables.json").exists()
 
 
 class TestIntegration:
-    """Tests d'intégration sur les PDFs réels"""
-    
-    def test_extract_journaux_chantier(self):
-        """Test sur le PDF des journaux de chantier"""
-        pdf_path = UPLOAD_DIR / "ESC_A57_000675_EXE_GEN_0-0000_SS_JDC_5108_A_Journaux_de_chantier_2023_S01.pdf"
-        
-        if not pdf_path.exists():
-            pytest.skip(f"PDF non trouvé: {pdf_path}")
-        
+    """Tests d'intégration sur les PDFs réels (un test paramétré par PDF)"""
+
+    @pytest.fixture(scope="class")
+    def integration_pipeline(self):
+        """Pipeline ACCURATE partagé ; seules les pages changent par PDF."""
         config = PipelineConfig(
             mode=ExtractionMode.ACCURATE,
             ocr_engine="tesseract",
             ocr_lang="fra",
             dpi=200,
-            pages=[0, 1],  # Premières pages seulement
-            save_images=True,
+            save_images=False,  # l'encodage PNG des pages 200 DPI ne gate rien ici
         )
-        
-        pipeline = TableExtractionPipeline(config)
-        result = pipeline.extract(pdf_path, OUTPUT_DIR)
-        
-        assert result is not None
-        print(f"\n📊 Résultat: {len(result.tables)} tableaux extraits")
-        
-        for table in result.tables:
-            print(f"   Page {table.page_number + 1}: {table.num_rows}x{table.num_cols}")
-    
-    def test_extract_sdp(self):
-        """Test sur le PDF SDP"""
-        pdf_path = UPLOAD_DIR / "SDP Série D Ind A.pdf"
-        
+        return TableExtractionPipeline(config)
+
+    @pytest.mark.parametrize("pdf_name,pages", [
+        ("ESC_A57_000675_EXE_GEN_0-0000_SS_JDC_5108_A_Journaux_de_chantier_2023_S01.pdf", [0, 1]),
+        ("SDP Série D Ind A.pdf", [0, 1, 2]),
+    ])
+    def test_extract_real_pdf(self, integration_pipeline, pdf_name, pages, tmp_path, skip_if_last_passed):
+        """Extraction des premières pages d'un PDF réel"""
+        pdf_path = UPLOAD_DIR / pdf_name
+
         if not pdf_path.exists():
             pytest.skip(f"PDF non trouvé: {pdf_path}")
-        
-        config = PipelineConfig(
-            mode=ExtractionMode.ACCURATE,
-            ocr_engine="tesseract",
-            ocr_lang="fra",
-            dpi=200,
-            pages=[0, 1, 2],
-            save_images=True,
-        )
-        
-        pipeline = TableExtractionPipeline(config)
-        result = pipeline.extract(pdf_path, OUTPUT_DIR)
-        
+
+        mark_passed = skip_if_last_passed(pdf_path)
+
+        integration_pipeline.config.pages = pages
+        # tmp_path : pas d'écriture dans data/output partagé (permet aussi
+        # l'exécution parallèle des tests d'intégration sans collision)
+        result = integration_pipeline.extract(pdf_path, tmp_path)
+
         assert result is not None
         print(f"\n📊 Résultat: {len(result.tables)} tableaux extraits")
 
+        for table in result.tables:
+            print(f"   Page {table.page_number + 1}: {table.num_rows}x{table.num_cols}")
+
+        mark_passed()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])